@@ -11,10 +11,16 @@ Features
 - Multi-browser support: Chrome, Firefox, Edge, Safari
 - Lazy initialization with explicit ``start()`` and ``stop()`` lifecycle
 - Context manager (``with`` statement) for guaranteed cleanup
-- Configurable page load timeout (default: 30s)
-- Automatic retry logic with exponential backoff (2 retries, 8s delay)
+- Configurable page load timeout (default: 30s) with eager load strategy
+- Automatic retry logic with jittered exponential backoff (2 retries, 8s base delay)
+- Per-host circuit breaker that skips hosts after repeated load failures
 - Stealth mode: disables automation flags and WebDriver detection
+- Optional lightweight mode that blocks images, fonts and video to cut page-load bytes
+- Optional persistent profile directory so HTTP cache carries across sessions
 - Optional human-like behavior simulation (scrolling, random pauses)
+- Optional warm driver pool so repeated sessions skip browser startup
+- Browsers are recycled after a visit count or age limit to shed leaked memory
+- Concurrent visits across pooled browsers with ``visit_sites_concurrent()``
 - Comprehensive logging with structured debug/info/warning/error levels
 - Rich return objects from ``visit_site()`` including status, duration, and attempts
 - Headless mode with browser-specific flags and Safari fallback
@@ -56,10 +62,19 @@ Author: Agile Creative Labs (c) 2025
 Version: 2.1.0
 License: MIT
 """
+import os
 import time
+import queue
+import atexit
 import random
 import logging
 import platform
+import subprocess
+import threading
+import weakref
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import urllib3
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -67,23 +82,156 @@ from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException, InvalidSessionIdException, NoSuchWindowException
+)
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
 from tqdm import tqdm
 
+# webdriver-manager logs every version probe at INFO; keep it quiet unless asked
+os.environ.setdefault('WDM_LOG_LEVEL', '0')
+
+# Selenium and urllib3 log every WebDriver command at DEBUG
+logging.getLogger('selenium').setLevel(logging.WARNING)
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+
 logger = logging.getLogger(__name__)
 
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# Page scripts for behavior simulation. Each is a single WebDriver round-trip.
+_PAGE_METRICS_JS = 'return [document.body.scrollHeight, window.innerHeight];'
+_PAGE_HEIGHT_JS = 'return document.body.scrollHeight;'
+_SCROLL_JS = (
+    'window.scrollBy(0, arguments[0]);'
+    'return window.pageYOffset + window.innerHeight >= document.body.scrollHeight;'
+)
+# Resource hints for the next site's origin, added to the page being dwelt on
+_PRECONNECT_JS = (
+    "for (const rel of ['dns-prefetch', 'preconnect']) {"
+    "const link = document.createElement('link');"
+    "link.rel = rel; link.href = arguments[0];"
+    "document.head.appendChild(link);"
+    "}"
+)
+
+
+class BrowserPool:
+    """Keeps warm webdriver instances keyed by browser configuration"""
+
+    def __init__(self):
+        self._queues = {}
+        self._lock = threading.Lock()
+
+    def _queue_for(self, key):
+        """Get (or create) the idle queue for a configuration key"""
+        with self._lock:
+            idle = self._queues.get(key)
+            if idle is None:
+                idle = self._queues[key] = queue.Queue()
+            return idle
+
+    def acquire(self, key):
+        """
+        Take an idle driver from the pool
+
+        Args:
+            key: Configuration key, e.g. (browser_name, headless, lightweight, profile_dir)
+
+        Returns:
+            tuple: (driver, uses) or None if no warm driver is available
+        """
+        try:
+            return self._queue_for(key).get_nowait()
+        except queue.Empty:
+            return None
+
+    def release(self, key, driver, uses):
+        """
+        Return a driver to the pool for reuse
+
+        Args:
+            key: Configuration key the driver was started with
+            driver: WebDriver instance
+            uses: Number of visits the driver has served so far
+        """
+        self._queue_for(key).put((driver, uses))
+
+    def idle_count(self, key):
+        """Number of idle drivers for a configuration key"""
+        return self._queue_for(key).qsize()
+
+    def shutdown(self):
+        """
+        Quit every idle driver and empty the pool
+
+        Returns:
+            list: The drivers that were quit
+        """
+        with self._lock:
+            queues = list(self._queues.values())
+            self._queues.clear()
+
+        drivers = []
+        for idle in queues:
+            while True:
+                try:
+                    driver, _ = idle.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.debug("Error quitting pooled browser: %s", e)
+                drivers.append(driver)
+        return drivers
+
+
 class BrowserController:
     """Controls browser automation for OSCAR testing"""
     
+    __slots__ = (
+        'browser_name', 'headless', 'simulate_behavior', 'show_progress', 'use_pool',
+        'lightweight', 'profile_dir', 'driver', 'platform', '_uses', '_driver_failed',
+        '_viewport_height', '_get_executor', '_active_profile', 'stop_event',
+        'debugger_address'
+    )
+    
     SUPPORTED_BROWSERS = ['chrome', 'firefox', 'edge', 'safari']
     MAX_RETRIES = 2
-    RETRY_DELAY = 8  # seconds
+    RETRY_DELAY = 8  # seconds, base delay doubled on each retry
+    RETRY_JITTER = True  # randomize delays so concurrent workers don't retry in lockstep
     PAGE_LOAD_TIMEOUT = 30  # seconds
+    HARD_TIMEOUT_GRACE = 5  # seconds past PAGE_LOAD_TIMEOUT before a hung get() is abandoned
+    PAGE_LOAD_STRATEGY = 'eager'  # return from get() at DOMContentLoaded
+    MAX_USES_PER_INSTANCE = 50  # visits before a driver is recycled
+    MAX_LIFETIME_SEC = 3600  # seconds before a driver is recycled
+    DRIVER_PATH_TTL = 3600  # seconds, same as Selenium Manager's driver TTL
+    DRIVER_CACHE_DIR = None  # directory persisting resolved driver paths across runs; None disables
+    DRIVER_CACHE_TTL = 7 * 24 * 3600  # seconds a persisted driver path is trusted
+    COMMAND_POOL_MAXSIZE = 10  # keep-alive connections to the driver process
+    CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failed loads before a host is skipped
+    CIRCUIT_RETRY_TIMEOUT = 15  # seconds before an open circuit allows a trial load
+    CIRCUIT_MAX_RETRY_TIMEOUT = 60  # seconds, cap for the circuit's backoff
+    DISK_CACHE_SIZE = 512 * 1024 * 1024  # bytes, Chromium cache in a persistent profile
+    # Requests dropped in lightweight Chromium sessions (images are disabled through prefs)
+    BLOCKED_URL_PATTERNS = ('*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm')
     
-    def __init__(self, browser_name='chrome', headless=False, simulate_behavior=False, show_progress=True):
+    pool = BrowserPool()
+    _driver_path_cache = {}  # browser name -> (driver path, resolved at, disk cache file or None)
+    _driver_path_lock = threading.Lock()
+    _circuits = {}  # host -> circuit breaker state
+    _circuit_lock = threading.Lock()
+    _profile_owners = {}  # profile dir -> driver running on it (None while launching)
+    _profile_lock = threading.Lock()
+    _driver_started = weakref.WeakKeyDictionary()  # driver -> monotonic launch time, survives pooling
+    
+    def __init__(self, browser_name='chrome', headless=False, simulate_behavior=False, show_progress=True,
+                 use_pool=False, lightweight=False, profile_dir=None, stop_event=None,
+                 debugger_address=None):
         """
         Initialize browser controller
         
@@ -92,13 +240,37 @@ class BrowserController:
             headless: Run browser in headless mode
             simulate_behavior: Enable simple user behavior simulation
             show_progress: Show progress bars during waits
+            use_pool: Take drivers from / return drivers to the shared warm pool
+            lightweight: Block images and notifications (and fonts and video
+                in Chrome and Edge) to cut page-load bytes
+            profile_dir: Persistent browser profile directory, so the HTTP
+                cache, HSTS entries and TLS session tickets survive restarts.
+                Only one browser can use a profile at a time; others fall
+                back to a temporary profile.
+            stop_event: Optional threading.Event; setting it cuts any
+                in-progress dwell short so shutdown doesn't wait out the visit
+            debugger_address: host:port of an already-running Chrome or Edge
+                started with --remote-debugging-port. The driver attaches to
+                it instead of launching a browser, and stopping leaves it
+                running for the next run. Launch options such as headless,
+                lightweight and profile_dir don't apply to it.
         """
         self.browser_name = browser_name.lower()
         self.headless = headless
         self.simulate_behavior = simulate_behavior
         self.show_progress = show_progress
+        self.use_pool = use_pool
+        self.lightweight = lightweight
+        self.profile_dir = os.path.abspath(profile_dir) if profile_dir else None
+        self._active_profile = None
+        self.stop_event = stop_event
+        self.debugger_address = debugger_address
         self.driver = None
         self.platform = platform.system()
+        self._uses = 0
+        self._driver_failed = False
+        self._viewport_height = None  # cached on first behavior simulation
+        self._get_executor = None  # runs driver.get() so it can be bounded
         
         if self.browser_name not in self.SUPPORTED_BROWSERS:
             raise ValueError(f"Unsupported browser: {browser_name}. Choose from {self.SUPPORTED_BROWSERS}")
@@ -107,122 +279,600 @@ class BrowserController:
         if self.browser_name == 'safari' and self.platform != 'Darwin':
             raise ValueError(f"Safari is only available on macOS. Current platform: {self.platform}")
         
+        if self.debugger_address and self.browser_name not in ('chrome', 'edge'):
+            raise ValueError("Attaching to a running browser is only supported for Chrome and Edge")
+        
         if self.headless and self.browser_name == 'safari':
             logger.warning("Safari does not support headless mode. Running in normal mode.")
             self.headless = False
         
-        logger.info(f"Initializing {self.browser_name} browser on {self.platform} (headless={self.headless}, simulate_behavior={self.simulate_behavior})")
+        logger.info(
+            "Initializing %s browser on %s (headless=%s, simulate_behavior=%s)",
+            self.browser_name, self.platform, self.headless, self.simulate_behavior
+        )
+    
+    @property
+    def _pool_key(self):
+        """Key identifying drivers that are interchangeable with this controller's"""
+        return (self.browser_name, self.headless, self.lightweight, self.profile_dir, self.debugger_address)
     
     def start(self):
-        """Start the browser instance"""
+        """Start the browser instance (or take a warm one from the pool)"""
+        self._driver_failed = False
+        self._viewport_height = None
+        
+        if self.use_pool:
+            pooled = self.pool.acquire(self._pool_key)
+            if pooled is not None:
+                self.driver, self._uses = pooled
+                logger.info("Reusing warm %s browser (%d previous visits)", self.browser_name, self._uses)
+                return True
+        
         try:
-            if self.browser_name == 'chrome':
-                self.driver = self._start_chrome()
-            elif self.browser_name == 'firefox':
-                self.driver = self._start_firefox()
-            elif self.browser_name == 'edge':
-                self.driver = self._start_edge()
-            elif self.browser_name == 'safari':
-                self.driver = self._start_safari()
-            
-            self.driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
-            logger.info(f"{self.browser_name.capitalize()} browser started successfully")
+            self.driver = self._launch_driver()
+            self._uses = 0
+            logger.info("%s browser started successfully", self.browser_name.capitalize())
             return True
         
         except Exception as e:
-            logger.error(f"Failed to start {self.browser_name} browser: {e}")
+            logger.error("Failed to start %s browser: %s", self.browser_name, e)
             return False
     
+    def _launch_driver(self):
+        """Launch a new webdriver for the configured browser"""
+        self._active_profile = self._claim_profile()
+        try:
+            try:
+                driver = self._start_browser()
+            except Exception as e:
+                # A driver path persisted by an earlier run may no longer
+                # match the browser; resolve it again and retry once
+                if not self._forget_driver_path(self.browser_name):
+                    raise
+                logger.warning("Cached %s driver failed to launch (%s); resolving it again", self.browser_name, e)
+                driver = self._start_browser()
+        except Exception:
+            if self._active_profile:
+                with self._profile_lock:
+                    self._profile_owners.pop(self._active_profile, None)
+            raise
+        
+        if self._active_profile:
+            with self._profile_lock:
+                self._profile_owners[self._active_profile] = driver
+        
+        self._driver_started[driver] = time.monotonic()
+        self._tune_command_executor(driver)
+        if self.lightweight and not self.debugger_address and self.browser_name in ('chrome', 'edge'):
+            self._block_heavy_requests(driver)
+        driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+        return driver
+    
+    def _start_browser(self):
+        """Start the configured browser"""
+        if self.browser_name == 'chrome':
+            return self._start_chrome()
+        elif self.browser_name == 'firefox':
+            return self._start_firefox()
+        elif self.browser_name == 'edge':
+            return self._start_edge()
+        elif self.browser_name == 'safari':
+            return self._start_safari()
+    
+    def _claim_profile(self):
+        """
+        Reserve the persistent profile directory for a new browser
+        
+        Returns:
+            str: The profile directory, or None to use a temporary profile
+        """
+        if not self.profile_dir or self.browser_name == 'safari' or self.debugger_address:
+            return None
+        
+        with self._profile_lock:
+            if self.profile_dir in self._profile_owners:
+                logger.warning("Profile %s is already in use; starting with a temporary profile", self.profile_dir)
+                return None
+            self._profile_owners[self.profile_dir] = None
+        
+        os.makedirs(self.profile_dir, exist_ok=True)
+        return self.profile_dir
+    
+    @classmethod
+    def _release_profile(cls, driver):
+        """Free any profile directory held by a driver that has been quit"""
+        with cls._profile_lock:
+            for profile, owner in list(cls._profile_owners.items()):
+                if owner is driver:
+                    del cls._profile_owners[profile]
+    
+    def _tune_command_executor(self, driver):
+        """
+        Widen the keep-alive HTTP pool between Selenium and the driver process
+        
+        Selenium keeps a single-connection urllib3 pool per driver, so any
+        overlapping commands fall back to opening fresh connections.
+        """
+        executor = getattr(driver, 'command_executor', None)
+        conn = getattr(executor, '_conn', None)
+        if conn is None:
+            # keep-alive disabled, or a Selenium version with a different layout
+            return
+        
+        timeout = getattr(getattr(executor, '_client_config', None), 'timeout', None)
+        conn.clear()
+        executor._conn = urllib3.PoolManager(maxsize=self.COMMAND_POOL_MAXSIZE, timeout=timeout)
+    
+    def prewarm(self, count):
+        """
+        Launch browsers ahead of time and park them in the pool
+        
+        Args:
+            count: Number of drivers to pre-launch
+            
+        Returns:
+            int: Number of drivers successfully added to the pool
+        """
+        started = 0
+        for _ in range(count):
+            try:
+                driver = self._launch_driver()
+            except Exception as e:
+                logger.error("Failed to pre-warm %s browser: %s", self.browser_name, e)
+                break
+            self.pool.release(self._pool_key, driver, 0)
+            started += 1
+        
+        logger.info("Pre-warmed %d %s browser(s)", started, self.browser_name)
+        return started
+    
+    @classmethod
+    def shutdown_pool(cls):
+        """Quit all idle pooled browsers"""
+        for driver in cls.pool.shutdown():
+            cls._release_profile(driver)
+    
+    @classmethod
+    def _resolve_driver_path(cls, name, manager_cls):
+        """
+        Resolve a driver binary through webdriver-manager, cached per browser
+        
+        Args:
+            name: Browser name used as the cache key
+            manager_cls: webdriver-manager class to install with
+            
+        Returns:
+            str: Path to the driver executable
+        """
+        with cls._driver_path_lock:
+            path, resolved_at, _ = cls._driver_path_cache.get(name, (None, 0, None))
+            if path is None or time.monotonic() - resolved_at > cls.DRIVER_PATH_TTL:
+                version = cls._browser_version(name) if cls.DRIVER_CACHE_DIR else None
+                cache_file = cls._driver_cache_file(name, version)
+                path = cls._read_driver_cache(cache_file)
+                if path is None:
+                    path = manager_cls().install()
+                    cls._write_driver_cache(cache_file, path)
+                    cache_file = None
+                cls._driver_path_cache[name] = (path, time.monotonic(), cache_file)
+                logger.debug("Resolved %s driver: %s", name, path)
+            return path
+    
+    @classmethod
+    def _forget_driver_path(cls, name):
+        """
+        Drop a driver path that was read from the disk cache
+        
+        Returns:
+            bool: True if the path came from the disk cache and was dropped
+        """
+        with cls._driver_path_lock:
+            _, _, cache_file = cls._driver_path_cache.get(name, (None, 0, None))
+            if cache_file is None:
+                return False
+            del cls._driver_path_cache[name]
+        try:
+            os.remove(cache_file)
+        except OSError as e:
+            logger.debug("Could not remove %s: %s", cache_file, e)
+        return True
+    
+    @staticmethod
+    def _browser_version(name):
+        """
+        Version of the installed browser, read locally without a network lookup
+        
+        Returns:
+            str: The version, or None if it can't be determined
+        """
+        browser_type = {'chrome': ChromeType.GOOGLE, 'edge': ChromeType.MSEDGE, 'firefox': 'firefox'}.get(name)
+        if browser_type is None:
+            return None
+        try:
+            return OperationSystemManager().get_browser_version_from_os(browser_type)
+        except Exception as e:
+            logger.debug("Could not determine %s version: %s", name, e)
+            return None
+    
+    @classmethod
+    def _driver_cache_file(cls, name, version):
+        """
+        Path of the file persisting the driver path for a browser version
+        
+        Returns:
+            str: The file path, or None if the disk cache is disabled or the
+                browser version is unknown
+        """
+        if not cls.DRIVER_CACHE_DIR or not version:
+            return None
+        return os.path.join(cls.DRIVER_CACHE_DIR, f'driver_{name}_{version}.path')
+    
+    @classmethod
+    def _read_driver_cache(cls, cache_file):
+        """
+        Read a driver path persisted by an earlier run
+        
+        Skips webdriver-manager's version lookup, which is a network round-trip.
+        
+        Args:
+            cache_file: File from _driver_cache_file(), or None
+        
+        Returns:
+            str: The driver path, or None if not cached, stale or missing on disk
+        """
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                path = f.read().strip()
+            if not os.path.isfile(path):
+                return None
+            if time.time() - os.path.getmtime(cache_file) > cls.DRIVER_CACHE_TTL:
+                return None
+        except OSError:
+            return None
+        return path
+    
+    @staticmethod
+    def _write_driver_cache(cache_file, path):
+        """Persist a resolved driver path for later runs; failures are not fatal"""
+        if cache_file is None or not os.path.isfile(path):
+            return
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(path)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug("Could not persist driver path to %s: %s", cache_file, e)
+    
     def _start_chrome(self):
         """Start Chrome browser"""
         options = ChromeOptions()
-        if self.headless:
-            options.add_argument('--headless=new')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        options.page_load_strategy = self.PAGE_LOAD_STRATEGY
+        if self.debugger_address:
+            # Launch settings don't apply to a running browser, and
+            # chromedriver rejects most of them next to debuggerAddress
+            options.debugger_address = self.debugger_address
+        else:
+            if self.headless:
+                options.add_argument('--headless=new')
+            options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_experimental_option('excludeSwitches', ['enable-logging'])
+            if self.lightweight:
+                self._block_heavy_content(options)
+            if self._active_profile:
+                self._use_profile(options, self._active_profile)
         
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        service = ChromeService(
+            self._resolve_driver_path('chrome', ChromeDriverManager),
+            log_output=subprocess.DEVNULL  # driver chatter can fill the pipe and stall commands
+        )
+        return webdriver.Chrome(service=service, options=options, keep_alive=True)
     
     def _start_firefox(self):
         """Start Firefox browser"""
         options = FirefoxOptions()
+        options.page_load_strategy = self.PAGE_LOAD_STRATEGY
         if self.headless:
             options.add_argument('--headless')
         options.set_preference('dom.webdriver.enabled', False)
         options.set_preference('useAutomationExtension', False)
+        if self.lightweight:
+            options.set_preference('permissions.default.image', 2)
+        if self._active_profile:
+            # Run on the directory in place; Selenium's FirefoxProfile would
+            # copy it to a temp dir and discard the cache on quit
+            options.add_argument('-profile')
+            options.add_argument(self._active_profile)
+            options.set_preference('browser.cache.disk.enable', True)
         
-        service = FirefoxService(GeckoDriverManager().install())
-        return webdriver.Firefox(service=service, options=options)
+        service = FirefoxService(
+            self._resolve_driver_path('firefox', GeckoDriverManager),
+            log_output=subprocess.DEVNULL
+        )
+        return webdriver.Firefox(service=service, options=options, keep_alive=True)
     
     def _start_edge(self):
         """Start Edge browser"""
         options = EdgeOptions()
-        if self.headless:
-            options.add_argument('--headless=new')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        options.page_load_strategy = self.PAGE_LOAD_STRATEGY
+        if self.debugger_address:
+            options.debugger_address = self.debugger_address
+        else:
+            if self.headless:
+                options.add_argument('--headless=new')
+            options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_experimental_option('excludeSwitches', ['enable-logging'])
+            if self.lightweight:
+                self._block_heavy_content(options)
+            if self._active_profile:
+                self._use_profile(options, self._active_profile)
         
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        return webdriver.Edge(service=service, options=options)
+        service = EdgeService(
+            self._resolve_driver_path('edge', EdgeChromiumDriverManager),
+            log_output=subprocess.DEVNULL
+        )
+        return webdriver.Edge(service=service, options=options, keep_alive=True)
+    
+    @staticmethod
+    def _block_heavy_content(options):
+        """Disable images and notification prompts on Chromium-based options"""
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+    
+    def _block_heavy_requests(self, driver):
+        """Block font and video downloads on a Chromium driver through CDP"""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(self.BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            logger.debug("Could not block heavy requests: %s", e)
+    
+    def _use_profile(self, options, profile_dir):
+        """Point Chromium-based options at a persistent profile with a large disk cache"""
+        options.add_argument(f'--user-data-dir={profile_dir}')
+        options.add_argument(f'--disk-cache-size={self.DISK_CACHE_SIZE}')
     
     def _start_safari(self):
         """Start Safari browser"""
         # Safari driver comes pre-installed on macOS, no webdriver-manager needed
-        return webdriver.Safari()
+        return webdriver.Safari(keep_alive=True)
+    
+    @staticmethod
+    def _with_scheme(url):
+        """URL with https:// added if it has no scheme"""
+        if not url.startswith(_HTTP_PREFIXES):
+            url = 'https://' + url
+        return url
+    
+    @classmethod
+    def _host_of(cls, url):
+        """Host part of a URL, with or without a scheme"""
+        return urlparse(cls._with_scheme(url)).netloc.lower()
     
-    def navigate_to(self, url):
+    @classmethod
+    def _check_circuit(cls, host):
+        """
+        Check whether a host may be visited
+        
+        An open circuit turns half-open once its retry timeout has elapsed,
+        letting a single trial load through; the outcome of that load closes
+        or re-opens it. Other callers are turned away while it runs.
+        
+        Returns:
+            bool: False while the host's circuit is open or a trial is running
+        """
+        with cls._circuit_lock:
+            circuit = cls._circuits.get(host)
+            if circuit is None or circuit['state'] == 'closed':
+                return True
+            if circuit['state'] == 'open':
+                if time.monotonic() - circuit['opened_at'] < circuit['retry_timeout']:
+                    return False
+                circuit['state'] = 'half_open'
+            if circuit['trial']:
+                return False
+            circuit['trial'] = True
+            return True
+    
+    @classmethod
+    def _end_trial(cls, host):
+        """Clear the host's trial-in-flight marker, if any"""
+        with cls._circuit_lock:
+            circuit = cls._circuits.get(host)
+            if circuit is not None:
+                circuit['trial'] = False
+    
+    @classmethod
+    def next_circuit_retry(cls):
+        """
+        Earliest time an open circuit will let a trial load through
+        
+        Returns:
+            float: time.monotonic() value, already past for a half-open
+                circuit, or None if no circuit is open or half-open
+        """
+        with cls._circuit_lock:
+            retry_times = [
+                circuit['opened_at'] + circuit['retry_timeout']
+                for circuit in cls._circuits.values()
+                if circuit['state'] != 'closed'
+            ]
+        return min(retry_times, default=None)
+    
+    @classmethod
+    def _record_success(cls, host):
+        """Close the host's circuit after a successful load"""
+        with cls._circuit_lock:
+            cls._circuits.pop(host, None)
+    
+    @classmethod
+    def _record_failure(cls, host):
+        """
+        Count a failed load against the host's circuit
+        
+        Returns:
+            bool: True if the circuit is now open
+        """
+        with cls._circuit_lock:
+            circuit = cls._circuits.setdefault(host, {
+                'state': 'closed',
+                'failures': 0,
+                'opened_at': 0,
+                'retry_timeout': cls.CIRCUIT_RETRY_TIMEOUT,
+                'trial': False  # a half-open trial load is in flight
+            })
+            circuit['failures'] += 1
+            circuit['trial'] = False
+            
+            if circuit['state'] == 'half_open':
+                # Trial load failed: back off further before the next one
+                circuit['retry_timeout'] = min(circuit['retry_timeout'] * 2, cls.CIRCUIT_MAX_RETRY_TIMEOUT)
+            elif circuit['state'] == 'open' or circuit['failures'] < cls.CIRCUIT_FAILURE_THRESHOLD:
+                return circuit['state'] == 'open'
+            
+            circuit['state'] = 'open'
+            circuit['opened_at'] = time.monotonic()
+            logger.warning(
+                "Circuit open for %s after %d failures; skipping it for %ds",
+                host, circuit['failures'], circuit['retry_timeout']
+            )
+            return True
+    
+    def _backoff(self, attempt):
+        """
+        Delay before the next navigation retry
+        
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            
+        Returns:
+            float: Seconds to sleep, capped at PAGE_LOAD_TIMEOUT
+        """
+        delay = self.RETRY_DELAY * (2 ** attempt)
+        if self.RETRY_JITTER:
+            delay *= random.uniform(0.5, 1.5)
+        return min(delay, self.PAGE_LOAD_TIMEOUT)
+    
+    def _bounded_get(self, url):
+        """
+        Load a URL with a hard upper bound on the wait
+        
+        Some drivers don't honor the page load timeout and hang in get();
+        running it on a helper thread lets us give up regardless.
+        
+        Raises:
+            TimeoutException: If get() hasn't returned within
+                PAGE_LOAD_TIMEOUT + HARD_TIMEOUT_GRACE seconds
+        """
+        if self._get_executor is None:
+            self._get_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='driver-get')
+        
+        future = self._get_executor.submit(self.driver.get, url)
+        try:
+            return future.result(timeout=self.PAGE_LOAD_TIMEOUT + self.HARD_TIMEOUT_GRACE)
+        except FutureTimeoutError:
+            # The helper thread is stuck in get(); abandon it and flag the
+            # driver for recycling. Any further command to it could hang too.
+            self._get_executor.shutdown(wait=False)
+            self._get_executor = None
+            self._driver_failed = True
+            raise TimeoutException(f"driver.get() did not return for {url}")
+    
+    def navigate_to(self, url, check_circuit=True):
         """
         Navigate to a URL with retry logic
         
         Args:
             url: Website URL to visit
+            check_circuit: False if the caller has already passed
+                _check_circuit() for this host (and so holds any trial load)
             
         Returns:
             bool: True if navigation successful, False otherwise
         """
+        url = self._with_scheme(url)
+        host = self._host_of(url)
+        if check_circuit and not self._check_circuit(host):
+            logger.warning("Skipping %s: circuit open after repeated failures", url)
+            return False
+        
+        try:
+            return self._navigate(url, host)
+        finally:
+            # Let the next caller make the trial load if this one ended
+            # without a verdict on the host
+            self._end_trial(host)
+    
+    def _navigate(self, url, host):
+        """Load a URL (including its scheme) with retries; see navigate_to()"""
         if not self.driver:
             logger.error("Browser not started")
             return False
         
-        # Ensure URL has protocol
-        if not url.startswith(('http://', 'https://')):
-            url = f'https://{url}'
-        
-        logger.info(f"Navigating to {url}")
+        logger.info("Navigating to %s", url)
         
         # Try loading the page with retries
         for attempt in range(self.MAX_RETRIES + 1):
             try:
-                self.driver.get(url)
+                # With the eager strategy get() returns once the DOM is ready;
+                # subresources keep loading while we dwell on the page
+                self._bounded_get(url)
                 
-                # Wait for page to be loaded
-                self.driver.execute_script('return document.readyState') == 'complete'
-                
-                logger.info(f"Successfully loaded {url}")
+                self._record_success(host)
+                logger.info("Successfully loaded %s", url)
                 return True
             
             except TimeoutException:
-                logger.warning(f"Timeout loading {url} (attempt {attempt + 1}/{self.MAX_RETRIES + 1})")
+                logger.warning("Timeout loading %s (attempt %d/%d)", url, attempt + 1, self.MAX_RETRIES + 1)
+                if self._record_failure(host) or self._driver_failed:
+                    # A hung driver isn't retried; the caller recycles it
+                    return False
                 if attempt < self.MAX_RETRIES:
-                    logger.info(f"Retrying in {self.RETRY_DELAY} seconds...")
-                    time.sleep(self.RETRY_DELAY)
+                    delay = self._backoff(attempt)
+                    logger.info("Retrying in %.1f seconds...", delay)
+                    if self._pause(delay):
+                        return False
                 else:
-                    logger.error(f"Failed to load {url} after {self.MAX_RETRIES + 1} attempts")
+                    logger.error("Failed to load %s after %d attempts", url, self.MAX_RETRIES + 1)
                     return False
             
+            except (InvalidSessionIdException, NoSuchWindowException) as e:
+                # The browser session itself is gone, not the page; no retry
+                # can succeed, so hand back for the driver to be recycled
+                self._driver_failed = True
+                logger.error("Browser session lost while loading %s: %s", url, e)
+                return False
+            
             except WebDriverException as e:
-                logger.error(f"WebDriver error on {url} (attempt {attempt + 1}/{self.MAX_RETRIES + 1}): {e}")
+                # Page-level errors such as net::ERR_NAME_NOT_RESOLVED count
+                # against the host, not the driver
+                logger.error("WebDriver error on %s (attempt %d/%d): %s", url, attempt + 1, self.MAX_RETRIES + 1, e)
+                if self._record_failure(host):
+                    return False
                 if attempt < self.MAX_RETRIES:
-                    logger.info(f"Retrying in {self.RETRY_DELAY} seconds...")
-                    time.sleep(self.RETRY_DELAY)
+                    delay = self._backoff(attempt)
+                    logger.info("Retrying in %.1f seconds...", delay)
+                    if self._pause(delay):
+                        return False
                 else:
                     return False
             
+            except (OSError, urllib3.exceptions.HTTPError) as e:
+                # Selenium couldn't reach the driver process
+                self._driver_failed = True
+                logger.error("Lost connection to the %s driver: %s", self.browser_name, e)
+                return False
+            
             except Exception as e:
-                logger.error(f"Unexpected error visiting {url}: {e}")
+                logger.error("Unexpected error visiting %s: %s", url, e)
                 return False
         
         return False
@@ -240,9 +890,28 @@ class BrowserController:
         try:
             return self.driver.title
         except Exception as e:
-            logger.debug(f"Could not get page title: {e}")
+            logger.debug("Could not get page title: %s", e)
             return ""
     
+    def _pause(self, seconds):
+        """
+        Sleep on the current page, waking early if stop_event is set
+        
+        Args:
+            seconds: Time to wait
+        
+        Returns:
+            bool: True if the controller was asked to stop
+        """
+        if self.stop_event is None:
+            time.sleep(seconds)
+            return False
+        return self.stop_event.wait(seconds)
+    
+    def _stopping(self):
+        """Whether stop_event has been set"""
+        return self.stop_event is not None and self.stop_event.is_set()
+    
     def simulate_user_activity(self, duration_seconds, url_display=""):
         """
         Simulate simple user behavior (scrolling, small pauses) with progress bar
@@ -255,110 +924,236 @@ class BrowserController:
             # Just wait passively with progress bar
             if self.show_progress:
                 desc = f"Waiting on site" if not url_display else f"On: {url_display[:50]}"
-                for _ in tqdm(range(duration_seconds), desc=desc, unit="s", ncols=100, leave=False):
-                    time.sleep(1)
+                with tqdm(range(duration_seconds), desc=desc, unit="s", ncols=100, leave=False) as bar:
+                    for _ in bar:
+                        if self._pause(1):
+                            break
             else:
-                time.sleep(duration_seconds)
+                self._pause(duration_seconds)
             return
         
-        end_time = time.time() + duration_seconds
+        end_time = time.monotonic() + duration_seconds
+        pbar = None
         
         try:
-            # Get page height
-            page_height = self.driver.execute_script('return document.body.scrollHeight')
-            viewport_height = self.driver.execute_script('return window.innerHeight')
+            # The window isn't resized during a session, so the viewport
+            # height is fetched once and only the page height per visit
+            if self._viewport_height is None:
+                page_height, self._viewport_height = self.driver.execute_script(_PAGE_METRICS_JS)
+            else:
+                page_height = self.driver.execute_script(_PAGE_HEIGHT_JS)
+            viewport_height = self._viewport_height
             
             scroll_count = 0
-            max_scrolls = 5
+            # Nothing to scroll on pages that fit in the viewport
+            max_scrolls = 5 if page_height > viewport_height else 0
             
             # Progress bar for behavior simulation
             if self.show_progress:
                 desc = f"Simulating activity" if not url_display else f"Active: {url_display[:50]}"
                 pbar = tqdm(total=duration_seconds, desc=desc, unit="s", ncols=100, leave=False)
             
-            start_time = time.time()
-            last_update = start_time
-            
-            while time.time() < end_time and scroll_count < max_scrolls:
+            while time.monotonic() < end_time and scroll_count < max_scrolls and not self._stopping():
                 # Random scroll distance (10-40% of viewport)
                 scroll_distance = random.randint(
                     int(viewport_height * 0.1),
                     int(viewport_height * 0.4)
                 )
                 
-                # Scroll down
-                self.driver.execute_script(f'window.scrollBy(0, {scroll_distance});')
+                # Scroll down; the same call reports whether we hit the bottom
+                at_bottom = self.driver.execute_script(_SCROLL_JS, scroll_distance)
                 scroll_count += 1
+                if at_bottom:
+                    break
                 
                 # Random pause between scrolls (2-5 seconds)
                 pause_time = random.uniform(2, 5)
-                sleep_duration = min(pause_time, end_time - time.time())
+                sleep_duration = min(pause_time, end_time - time.monotonic())
                 
                 if sleep_duration > 0:
                     if self.show_progress:
                         # Update progress bar during sleep
                         for _ in range(int(sleep_duration)):
-                            time.sleep(1)
-                            elapsed = time.time() - start_time
+                            if self._pause(1):
+                                break
                             pbar.update(1)
                         # Handle fractional seconds
                         remaining_fraction = sleep_duration - int(sleep_duration)
-                        if remaining_fraction > 0:
-                            time.sleep(remaining_fraction)
+                        if remaining_fraction > 0 and not self._stopping():
+                            self._pause(remaining_fraction)
                     else:
-                        time.sleep(sleep_duration)
+                        self._pause(sleep_duration)
                 
-                if time.time() >= end_time:
+                if time.monotonic() >= end_time or self._stopping():
                     break
             
             # Wait for remaining time
-            remaining = end_time - time.time()
-            if remaining > 0:
+            remaining = end_time - time.monotonic()
+            if remaining > 0 and not self._stopping():
                 if self.show_progress:
                     for _ in range(int(remaining)):
-                        time.sleep(1)
+                        if self._pause(1):
+                            break
                         pbar.update(1)
                     remaining_fraction = remaining - int(remaining)
-                    if remaining_fraction > 0:
-                        time.sleep(remaining_fraction)
-                    pbar.close()
+                    if remaining_fraction > 0 and not self._stopping():
+                        self._pause(remaining_fraction)
                 else:
-                    time.sleep(remaining)
+                    self._pause(remaining)
         
         except Exception as e:
-            logger.debug(f"Behavior simulation error (non-critical): {e}")
+            logger.debug("Behavior simulation error (non-critical): %s", e)
+            if pbar is not None:
+                pbar.close()
             # Fallback to simple wait if simulation fails
-            remaining = end_time - time.time()
-            if remaining > 0:
+            remaining = end_time - time.monotonic()
+            if remaining > 0 and not self._stopping():
                 if self.show_progress:
-                    for _ in tqdm(range(int(remaining)), desc="Waiting (fallback)", unit="s", ncols=100, leave=False):
-                        time.sleep(1)
+                    with tqdm(range(int(remaining)), desc="Waiting (fallback)", unit="s", ncols=100,
+                              leave=False) as bar:
+                        for _ in bar:
+                            if self._pause(1):
+                                break
                 else:
-                    time.sleep(remaining)
+                    self._pause(remaining)
+        
+        finally:
+            # Early exits (bottom of page, stop_event) must not leave a stale bar
+            if pbar is not None:
+                pbar.close()
     
     def stop(self):
-        """Stop and close the browser"""
+        """Stop and close the browser (or return it to the pool)"""
+        if self._get_executor is not None:
+            self._get_executor.shutdown(wait=False)
+            self._get_executor = None
         if self.driver:
+            if self.debugger_address:
+                self._detach()
+                return
+            if self.use_pool and self._release_to_pool():
+                return
             try:
                 self.driver.quit()
-                logger.info(f"{self.browser_name.capitalize()} browser closed")
+                logger.info("%s browser closed", self.browser_name.capitalize())
             except Exception as e:
-                logger.error(f"Error closing browser: {e}")
+                logger.error("Error closing browser: %s", e)
             finally:
+                self._release_profile(self.driver)
                 self.driver = None
+                self._viewport_height = None
+    
+    def _detach(self):
+        """
+        Stop the driver attached through debugger_address
+        
+        The browser belongs to the user, so its cookies and open page are
+        left alone and it isn't quit; only the driver process is stopped.
+        """
+        try:
+            self.driver.service.stop()
+            logger.info("Detached from %s browser at %s", self.browser_name, self.debugger_address)
+        except Exception as e:
+            logger.error("Error detaching from browser: %s", e)
+        finally:
+            self.driver = None
+            self._viewport_height = None
+    
+    def _worn_out(self):
+        """
+        Check whether the current driver has served long enough to be replaced
+        
+        Long-lived browsers accumulate leaked renderer memory and slow down,
+        so drivers are retired after MAX_USES_PER_INSTANCE visits or
+        MAX_LIFETIME_SEC seconds, whichever comes first.
+        """
+        if self._uses >= self.MAX_USES_PER_INSTANCE:
+            return True
+        started = self._driver_started.get(self.driver)
+        return started is not None and time.monotonic() - started >= self.MAX_LIFETIME_SEC
+    
+    def _recycle_driver(self):
+        """
+        Quit the current driver and start a fresh one
+        
+        A failed start is retried with the navigation backoff, unless
+        stop_event is set in the meantime.
+        
+        Returns:
+            bool: True if a new driver is running
+        """
+        if self._driver_failed:
+            logger.info("Recycling %s browser after a driver failure", self.browser_name)
+        else:
+            logger.info("Recycling %s browser after %d visits", self.browser_name, self._uses)
+        use_pool, self.use_pool = self.use_pool, False
+        try:
+            self.stop()
+        finally:
+            self.use_pool = use_pool
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            if self.start():
+                return True
+            if attempt < self.MAX_RETRIES and self._pause(self._backoff(attempt)):
+                break
+        logger.error("Could not restart %s browser", self.browser_name)
+        return False
+    
+    def _release_to_pool(self):
+        """
+        Reset the current driver and park it in the pool
+        
+        Returns:
+            bool: True if the driver was pooled, False if it should be quit
+        """
+        if self._driver_failed or self._worn_out():
+            logger.debug("Recycling %s browser after %d visits", self.browser_name, self._uses)
+            return False
+        
+        try:
+            # Isolate the next session from this one
+            self.driver.delete_all_cookies()
+            self.driver.get('about:blank')
+        except Exception as e:
+            logger.debug("Could not reset browser for reuse: %s", e)
+            return False
+        
+        self.pool.release(self._pool_key, self.driver, self._uses)
+        self.driver = None
+        self._viewport_height = None
+        logger.info("%s browser returned to pool", self.browser_name.capitalize())
+        return True
 
-    def visit_site(self, url: str, duration_seconds: int) -> dict:
+    def _preconnect(self, url):
+        """
+        Ask the browser to resolve and connect to a URL's origin in the background
+        
+        Args:
+            url: URL that will be visited next
+        """
+        host = self._host_of(url)
+        scheme = 'http' if url.startswith('http://') else 'https'
+        try:
+            self.driver.execute_script(_PRECONNECT_JS, f"{scheme}://{host}")
+        except Exception as e:
+            logger.debug("Could not add preconnect hint for %s: %s", host, e)
+    
+    def visit_site(self, url: str, duration_seconds: int, next_url=None) -> dict:
         """
         High-level method to visit a site and simulate activity.
     
         Args:
             url: URL to visit
             duration_seconds: Time to spend on site
+            next_url: URL expected to be visited next; its DNS lookup and
+                connection are started during this dwell
     
         Returns:
-            dict with status, duration, title, error
+            dict with status, duration, title, error. Status is 'circuit_open'
+            when the host is being skipped after repeated failures.
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         result = {
             'url': url,
             'status': 'failed',
@@ -367,18 +1162,85 @@ class BrowserController:
             'error': None
         }
 
-        if not self.navigate_to(url):
+        host = self._host_of(url)
+        if not self._check_circuit(host):
+            result['status'] = 'circuit_open'
+            result['error'] = 'Host skipped after repeated failures'
+            return result
+
+        self._uses += 1
+        if not self.navigate_to(url, check_circuit=False):
             result['error'] = 'Navigation failed'
         else:
             # Extract display name from URL for progress bar
             url_display = url.replace('https://', '').replace('http://', '').split('/')[0]
+            if next_url and self._host_of(next_url) != self._host_of(url):
+                self._preconnect(next_url)
             self.simulate_user_activity(duration_seconds, url_display)
             result['title'] = self.get_page_title()
             result['status'] = 'success'
 
-        result['duration'] = round(time.time() - start_time, 2)
+        # A driver that hung or errored is replaced now rather than at stop()
+        if self.driver is not None and (self._driver_failed or self._worn_out()):
+            self._recycle_driver()
+
+        result['duration'] = round(time.monotonic() - start_time, 2)
         return result
     
+    def visit_sites_concurrent(self, urls, duration_seconds, concurrency=4):
+        """
+        Visit several sites in parallel so their dwell times overlap.
+        
+        Each worker thread drives its own pooled browser configured like this
+        controller; the browsers go back to the pool when the batch is done.
+    
+        Args:
+            urls: URLs to visit
+            duration_seconds: Time to spend on each site
+            concurrency: Maximum number of browsers running at once
+    
+        Returns:
+            list of visit_site() result dicts, in the same order as urls
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        
+        # An attached browser is shared by every session, so visit serially
+        workers = 1 if self.debugger_address else max(1, min(concurrency, len(urls)))
+        local = threading.local()
+        browsers = []
+        browsers_lock = threading.Lock()
+        
+        def visit(url):
+            browser = getattr(local, 'browser', None)
+            if browser is None:
+                browser = BrowserController(
+                    browser_name=self.browser_name,
+                    headless=self.headless,
+                    simulate_behavior=self.simulate_behavior,
+                    show_progress=False,
+                    use_pool=True,
+                    lightweight=self.lightweight,
+                    profile_dir=self.profile_dir,
+                    stop_event=self.stop_event,
+                    debugger_address=self.debugger_address
+                )
+                local.browser = browser
+                with browsers_lock:
+                    browsers.append(browser)
+            if browser.driver is None:
+                browser.start()
+            return browser.visit_site(url, duration_seconds)
+        
+        logger.info("Visiting %d sites with %d concurrent %s browsers", len(urls), workers, self.browser_name)
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='visit') as executor:
+                return list(executor.map(visit, urls))
+        finally:
+            for browser in browsers:
+                browser.stop()
+    
     def __enter__(self):
         """Context manager entry"""
         self.start()
@@ -387,4 +1249,7 @@ class BrowserController:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.stop()
-        return False
\ No newline at end of file
+        return False
+
+
+atexit.register(BrowserController.shutdown_pool)
@@ -5,86 +5,392 @@ Reads OSCAR's default_config.json and extracts browser categories
 and website lists for automated testing.
 """
 
+import os
+import re
+import sys
 import json
+import mmap
+import hashlib
+import random
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Browser-internal pages, never testable
+_INTERNAL_TOKENS = (
+    'browser_internal', 'browser_new_tab', 'chrome_internal',
+    'edge_internal', 'firefox_internal', 'chrome_extension',
+    'firefox_extension'
+)
+# OS-level pages, also dropped from the combined site list
+_SYSTEM_PAGE_TOKENS = ('loginwindow', 'screensaver', 'lock_screen', 'system_security')
+
+
+def _token_matcher(tokens):
+    """
+    Build a case-insensitive "URL contains any of these tokens" predicate
+    
+    Uses a pyahocorasick automaton when installed, which scans each URL once
+    regardless of the number of tokens; otherwise a compiled regex alternation.
+    """
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for token in tokens:
+            automaton.add_word(token.lower(), token)
+        automaton.make_automaton()
+        return lambda url: next(automaton.iter(url.lower()), None) is not None
+    
+    pattern = re.compile('|'.join(map(re.escape, tokens)), re.IGNORECASE)
+    return lambda url: pattern.search(url) is not None
+
+
+_is_internal_page = _token_matcher(_INTERNAL_TOKENS)
+_is_system_page = _token_matcher(_SYSTEM_PAGE_TOKENS)
+
+# Categories that hold no testable sites
+_SYSTEM_CATEGORIES = frozenset({'Browser Internal', 'System/Security'})
+
 
 class ConfigLoader:
     """Loads and parses OSCAR configuration files"""
     
-    def __init__(self, config_path: str = 'config/default_config.json'):
+    MMAP_THRESHOLD = 1024 * 1024  # bytes; larger configs are parsed straight from the page cache
+    CACHE_DIR = None  # directory for the parsed site index; None disables the cache
+    CACHE_VERSION = 3  # bump when the cached index layout changes
+    
+    def __init__(self, config_path: str = 'config/default_config.json', use_cache: bool = True):
         """
         Initialize config loader
         
         Args:
             config_path: Path to OSCAR config JSON file
+            use_cache: Reuse the parsed site index saved in CACHE_DIR while
+                the config file is unchanged
         """
         self.config_path = Path(config_path)
-        self.config = None
+        self.cache_path = self._cache_file()
+        self.use_cache = use_cache and self.cache_path is not None
+        self._config = None
         self.browser_categories = {}
+        self._all_sites = []
+        self._clean_categories = {}
+        self._category_keys = {}
+        self._categories = []
+        self._category_counts = {}
         
         self._load_config()
     
+    @property
+    def config(self):
+        """Parsed configuration file; read on first access when the index came from the cache"""
+        if self._config is None and self.config_path.exists():
+            self._config = self._read_config()
+        return self._config
+    
+    def reload(self):
+        """Re-read the configuration file and rebuild the cached site lists"""
+        self._load_config()
+    
     def _load_config(self):
         """Load and parse the configuration file"""
         if not self.config_path.exists():
-            logger.error(f"Config file not found: {self.config_path}")
+            logger.error("Config file not found: %s", self.config_path)
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self._config = None
+            stat = self.config_path.stat()
             
-            # Extract browser categories
-            self.browser_categories = self.config.get('browser_categories', {})
+            if not self._load_cache(stat):
+                self._config = self._read_config()
+                
+                # Extract browser categories (materializes them if the config is a lazy proxy).
+                # Interned names are shared by every (url, category) tuple built from them.
+                self.browser_categories = {
+                    sys.intern(category): list(urls)
+                    for category, urls in self._config.get('browser_categories', {}).items()
+                }
+                self._index_sites()
+                self._save_cache(stat)
             
             if not self.browser_categories:
                 logger.warning("No browser_categories found in config")
             else:
-                logger.info(f"Loaded {len(self.browser_categories)} browser categories")
-                for category, sites in self.browser_categories.items():
-                    logger.debug(f"  {category}: {len(sites)} sites")
+                logger.info("Loaded %d browser categories", len(self.browser_categories))
+                # Skip the per-category loop entirely unless it will be logged
+                if logger.isEnabledFor(logging.DEBUG):
+                    for category, sites in self.browser_categories.items():
+                        logger.debug("  %s: %d sites", category, len(sites))
         
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in config file: {e}")
+            logger.error("Invalid JSON in config file: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
             raise
     
-    def get_all_sites(self) -> List[Tuple[str, str]]:
+    def _cache_file(self):
         """
-        Get all sites from all browser categories
+        Path of the site index cache for this config file
         
         Returns:
-            List of (url, category) tuples
+            Path inside CACHE_DIR named after the config's absolute path, or
+            None if CACHE_DIR is not set
+        """
+        if not self.CACHE_DIR:
+            return None
+        digest = hashlib.sha1(str(self.config_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        return Path(self.CACHE_DIR) / f'config_index_{digest}.json'
+    
+    def _cache_tag(self, stat):
+        """Identify the config file version a cache entry was built from"""
+        return [self.CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+    
+    def _load_cache(self, stat) -> bool:
+        """
+        Restore the site index from the JSON cache
+        
+        The cache holds plain data only, so a tampered file can at worst
+        yield a wrong site list, never run code.
+        
+        Args:
+            stat: os.stat_result of the config file
+            
+        Returns:
+            True if a cache entry matching the config file was loaded
+        """
+        if not self.use_cache:
+            return False
+        
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = f.read()
+            cached = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+            if not isinstance(cached, dict) or cached.get('tag') != self._cache_tag(stat):
+                return False
+            
+            browser_categories = {sys.intern(k): list(v) for k, v in cached['browser_categories'].items()}
+            clean_categories = {sys.intern(k): list(v) for k, v in cached['clean_categories'].items()}
+            categories = [sys.intern(c) for c in cached['categories']]
+            category_counts = {sys.intern(k): int(v) for k, v in cached['category_counts'].items()}
+            all_sites = [(url, sys.intern(category)) for url, category in cached['all_sites']]
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug("Ignoring unreadable config cache %s: %s", self.cache_path, e)
+            return False
+        
+        self.browser_categories = browser_categories
+        self._clean_categories = clean_categories
+        self._categories = categories
+        self._category_counts = category_counts
+        self._all_sites = all_sites
+        self._index_category_keys()
+        logger.debug("Loaded site index from cache %s", self.cache_path)
+        return True
+    
+    def _save_cache(self, stat):
+        """Save the site index as JSON in CACHE_DIR; failures are not fatal"""
+        if not self.use_cache:
+            return
+        
+        cached = {
+            'tag': self._cache_tag(stat),
+            'browser_categories': self.browser_categories,
+            'clean_categories': self._clean_categories,
+            'categories': self._categories,
+            'category_counts': self._category_counts,
+            'all_sites': self._all_sites
+        }
+        # Write a temp file and rename it over the cache, so a concurrent
+        # loader never sees a half-written file
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(cached) if ORJSON_AVAILABLE else json.dumps(cached).encode('utf-8'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug("Could not write config cache %s: %s", self.cache_path, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _read_config(self):
+        """
+        Read and parse the configuration file
+        
+        Large files are memory-mapped and handed to the parser directly,
+        which skips copying the whole file into a bytes object first. With
+        pysimdjson installed they are parsed on demand: the result is a lazy
+        simdjson.Object and only the sections that are read get converted
+        to Python objects. The stdlib parser needs bytes anyway, so without
+        either library the file is always read normally.
+        """
+        if (SIMDJSON_AVAILABLE or ORJSON_AVAILABLE) and self.config_path.stat().st_size > self.MMAP_THRESHOLD:
+            with open(self.config_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    if SIMDJSON_AVAILABLE:
+                        return self._parse_on_demand(view)
+                    return orjson.loads(view)
+        
+        return self._parse(self.config_path.read_bytes())
+    
+    @staticmethod
+    def _parse_on_demand(data):
+        """Parse JSON into a lazy simdjson document (copies data into the parser)"""
+        try:
+            return simdjson.Parser().parse(data)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), '', 0) from e
+    
+    @staticmethod
+    def _parse(data: bytes):
         """
-        all_sites = []
+        Parse JSON bytes, with orjson when it is installed
+        
+        orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+        handle both parsers the same way.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    def _index_sites(self):
+        """Filter the site lists once so the accessors don't rescan them per call"""
+        # Filter out internal/system pages
+        self._clean_categories = {
+            category: [url for url in urls if not _is_internal_page(url)]
+            for category, urls in self.browser_categories.items()
+        }
+        self._index_category_keys()
         
-        for category, urls in self.browser_categories.items():
+        self._categories = []
+        for category in self._clean_categories:
             # Skip internal/system categories
-            if category in ['Browser Internal', 'System/Security']:
-                logger.debug(f"Skipping system category: {category}")
+            if category in _SYSTEM_CATEGORIES:
+                logger.debug("Skipping system category: %s", category)
                 continue
+            self._categories.append(category)
+        
+        self._category_counts = {
+            category: len(self._clean_categories[category]) for category in self._categories
+        }
+        # OS-level pages only show up in the combined list. A URL listed under
+        # several categories is kept once, under the first, so a cycle
+        # doesn't load the same page twice.
+        first_category = {}
+        duplicates = 0
+        for category in self._categories:
+            for url in self._clean_categories[category]:
+                if url in first_category:
+                    duplicates += 1
+                elif not _is_system_page(url):
+                    first_category[url] = category
+        self._all_sites = list(first_category.items())
+        if duplicates:
+            logger.debug("Skipped %d duplicate site entries", duplicates)
+    
+    def _index_category_keys(self):
+        """Map case-folded category names to their config spelling"""
+        self._category_keys = {category.casefold(): category for category in self._clean_categories}
+    
+    def resolve_category(self, category_name: str) -> Optional[str]:
+        """
+        Find a category's name as spelled in the config, ignoring case
+        
+        Args:
+            category_name: Name of the category, e.g. from --categories
             
-            for url in urls:
-                # Skip internal browser pages
-                if any(internal in url.lower() for internal in [
-                    'browser_internal', 'browser_new_tab', 'chrome_internal',
-                    'edge_internal', 'firefox_internal', 'chrome_extension',
-                    'firefox_extension', 'loginwindow', 'screensaver',
-                    'lock_screen', 'system_security'
-                ]):
-                    continue
-                
-                all_sites.append((url, category))
+        Returns:
+            The config's category name, or None if there is no such category
+        """
+        if category_name in self._clean_categories:
+            return category_name
+        return self._category_keys.get(category_name.casefold())
+    
+    def _lookup_category(self, category_name: str):
+        """
+        Find a category's filtered URLs, ignoring case
+        
+        Args:
+            category_name: Name of the category, e.g. from --categories
+            
+        Returns:
+            List of URLs, or None if there is no such category
+        """
+        key = self.resolve_category(category_name)
+        return None if key is None else self._clean_categories[key]
+    
+    def iter_all_sites(self) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over all sites without copying the list
+        
+        Returns:
+            Iterator of (url, category) tuples
+        """
+        return iter(self._all_sites)
+    
+    def iter_sites_by_category(self, category_name: str) -> Iterator[str]:
+        """
+        Iterate over the sites of one category without copying the list
         
-        logger.info(f"Total testable sites: {len(all_sites)}")
-        return all_sites
+        Args:
+            category_name: Name of the category
+            
+        Returns:
+            Iterator of URLs in that category (empty if it doesn't exist)
+        """
+        urls = self._lookup_category(category_name)
+        if urls is None:
+            logger.warning("Category '%s' not found in config", category_name)
+            return iter(())
+        return iter(urls)
+    
+    def sample_sites(self, count: int, rng: Optional[random.Random] = None) -> List[Tuple[str, str]]:
+        """
+        Pick random sites from all categories without copying the full list
+        
+        Args:
+            count: Number of sites to pick (capped at the number available)
+            rng: Random generator to draw from; the module-level one by default
+            
+        Returns:
+            List of (url, category) tuples in random order
+        """
+        rng = rng or random
+        return rng.sample(self._all_sites, min(count, len(self._all_sites)))
+    
+    def get_all_sites(self) -> List[Tuple[str, str]]:
+        """
+        Get all sites from all browser categories
+        
+        Returns:
+            List of (url, category) tuples
+        """
+        logger.info("Total testable sites: %d", len(self._all_sites))
+        return list(self._all_sites)
     
     def get_sites_by_category(self, category_name: str) -> List[str]:
         """
@@ -96,24 +402,13 @@ class ConfigLoader:
         Returns:
             List of URLs in that category
         """
-        if category_name not in self.browser_categories:
-            logger.warning(f"Category '{category_name}' not found in config")
+        filtered_urls = self._lookup_category(category_name)
+        if filtered_urls is None:
+            logger.warning("Category '%s' not found in config", category_name)
             return []
         
-        urls = self.browser_categories[category_name]
-        
-        # Filter out internal/system pages
-        filtered_urls = [
-            url for url in urls
-            if not any(internal in url.lower() for internal in [
-                'browser_internal', 'browser_new_tab', 'chrome_internal',
-                'edge_internal', 'firefox_internal', 'chrome_extension',
-                'firefox_extension'
-            ])
-        ]
-        
-        logger.info(f"Category '{category_name}': {len(filtered_urls)} testable sites")
-        return filtered_urls
+        logger.info("Category '%s': %d testable sites", category_name, len(filtered_urls))
+        return list(filtered_urls)
     
     def get_categories(self) -> List[str]:
         """
@@ -122,12 +417,7 @@ class ConfigLoader:
         Returns:
             List of category names
         """
-        # Filter out system categories
-        categories = [
-            cat for cat in self.browser_categories.keys()
-            if cat not in ['Browser Internal', 'System/Security']
-        ]
-        return categories
+        return list(self._categories)
     
     def get_category_count(self) -> Dict[str, int]:
         """
@@ -136,20 +426,4 @@ class ConfigLoader:
         Returns:
             Dictionary mapping category names to site counts
         """
-        counts = {}
-        for category, urls in self.browser_categories.items():
-            if category in ['Browser Internal', 'System/Security']:
-                continue
-            
-            # Count only real URLs
-            real_urls = [
-                url for url in urls
-                if not any(internal in url.lower() for internal in [
-                    'browser_internal', 'browser_new_tab', 'chrome_internal',
-                    'edge_internal', 'firefox_internal', 'chrome_extension',
-                    'firefox_extension'
-                ])
-            ]
-            counts[category] = len(real_urls)
-        
-        return counts
+        return dict(self._category_counts)
@@ -9,6 +9,7 @@ Overview:
 Features:
     - Reads websites from default_config.json
     - Sequential navigation with configurable durations
+    - Optional concurrent browser workers (--workers)
     - Multi-browser support (Chrome, Firefox, Edge, Safari)
     - CSV output compatible with OSCAR's activity logs
     - Progress tracking with visual progress bars (tqdm)
@@ -39,6 +40,9 @@ Usage:
     
     # Different browser
     python test_automator.py --browser firefox --duration 30
+    
+    # Four browsers visiting sites concurrently
+    python test_automator.py --workers 4 --headless --duration 30
 
 Dependencies:
     pip install selenium webdriver-manager tqdm
@@ -47,62 +51,78 @@ Author: Agile Creative Labs Inc (c) 2025
 Part of OSCAR v1.0 - On-device System for Computing and Analytics Reporting
 Version: 2.0.0
 """
+import os
 import argparse
 import csv
+import gzip
+import shutil
+import re
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 import time
 import random
 import platform
+import itertools
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 from browser_controller import BrowserController
 from config_loader import ConfigLoader
 from tqdm import tqdm
 
-# Setup logging with UTF-8 encoding for cross-platform compatibility
-log_handlers = [
-    logging.FileHandler(
-        f'oscar_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log',
-        encoding='utf-8'
-    )
-]
-
-# Windows console encoding fix
-if platform.system() == 'Windows':
-    import sys
-    if sys.stdout.encoding != 'utf-8':
-        import io
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-    log_handlers.append(logging.StreamHandler(sys.stdout))
-else:
-    log_handlers.append(logging.StreamHandler(sys.stdout))
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=log_handlers
-)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+LOG_MAX_BYTES = 10 * 1024 * 1024  # rotate the run log at this size
+LOG_BACKUP_COUNT = 5  # rotated, gzip-compressed logs kept per run
+
 
 class OSCARTestAutomator:
     """Main automator class for OSCAR testing"""
     
-    def __init__(self, config_path='default_config.json'):
+    CSV_COLUMNS = ['timestamp', 'url', 'category', 'title', 'duration', 'status', 'cycle', 'error']
+    _DURATION_RE = re.compile(r'^(\d+)\s*([smh]?)$')
+    _UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600}
+    PROGRESS_MININTERVAL = 1.0  # seconds between progress bar redraws
+    
+    def __init__(self, config_path='default_config.json', reuse_browsers=False):
         """
         Initialize automator with config
         
         Args:
             config_path: Path to configuration JSON file
+            reuse_browsers: Park browsers in the warm pool when a run ends,
+                so a later run() in this process skips browser startup.
+                Call BrowserController.shutdown_pool() when done.
         """
         self.config_loader = ConfigLoader(config_path)
+        self.reuse_browsers = reuse_browsers
         self.visit_results = []
         self.start_time = None
         self.end_time = None
         self.platform = platform.system()
+        self._lock = threading.Lock()  # guards the site schedule, results, CSV and progress bars
+        self.csv_path = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._stop_event = threading.Event()
+        self._circuit_skips = 0  # consecutive schedule entries skipped on an open circuit
         
         # Use ASCII-safe symbols for Windows
         if self.platform == 'Windows':
@@ -112,9 +132,10 @@ class OSCARTestAutomator:
             self.success_symbol = '✓'
             self.fail_symbol = '✗'
         
-        logger.info(f"Running on {self.platform} ({platform.platform()})")
+        logger.info("Running on %s (%s)", self.platform, platform.platform())
     
-    def _parse_duration(self, duration_str, default_unit='minutes'):
+    @classmethod
+    def _parse_duration(cls, duration_str, default_unit='minutes'):
         """
         Parse duration string to seconds
         
@@ -124,53 +145,60 @@ class OSCARTestAutomator:
             
         Returns:
             int: Duration in seconds
+            
+        Raises:
+            ValueError: If the duration isn't a whole number with an optional unit
         """
         duration_str = str(duration_str).lower().strip()
         
-        try:
-            if duration_str.endswith('m'):
-                return int(duration_str[:-1]) * 60
-            elif duration_str.endswith('h'):
-                return int(duration_str[:-1]) * 3600
-            elif duration_str.endswith('s'):
-                return int(duration_str[:-1])
-            else:
-                # Plain number - use default unit
-                num = int(duration_str)
-                if default_unit == 'seconds':
-                    return num
-                else:
-                    return num * 60
-        except ValueError:
-            logger.error(f"Invalid duration: {duration_str}")
-            sys.exit(1)
-
-    def _get_sites(self, categories=None, sample=None):
-        """Get sites, optionally filtered and sampled"""
+        match = cls._DURATION_RE.match(duration_str)
+        if not match:
+            raise ValueError(f"Invalid duration: {duration_str!r}")
+        
+        value, unit = match.groups()
+        if not unit:
+            # Plain number - use default unit
+            unit = 's' if default_unit == 'seconds' else 'm'
+        return int(value) * cls._UNIT_SECONDS[unit]
+
+    def _get_sites(self, categories=None, sample=None, rng=None):
+        """Get sites, optionally filtered and sampled with rng (default: module random)"""
+        rng = rng or random
+        sample = sample if sample and sample > 0 else None
         if categories:
-            cats = [c.strip() for c in categories.split(',')]
-            sites = []
+            # Label sites with the config's spelling, so differently-cased
+            # requests for one category are counted together
+            cats = dict.fromkeys(
+                self.config_loader.resolve_category(c.strip()) or c.strip()
+                for c in categories.split(',')
+            )
+            # A URL in several of the requested categories is visited once,
+            # under the first, like in the combined site list
+            first_category = {}
             for cat in cats:
-                sites.extend([(url, cat) for url in self.config_loader.get_sites_by_category(cat)])
+                for url in self.config_loader.iter_sites_by_category(cat):
+                    first_category.setdefault(url, cat)
+            sites = list(first_category.items())
+            if sample:
+                sites = rng.sample(sites, min(sample, len(sites)))
+        elif sample:
+            # Sample straight from the loader rather than copying every site first
+            sites = self.config_loader.sample_sites(sample, rng=rng)
         else:
             sites = self.config_loader.get_all_sites()
 
-        if sample and sample > 0:
-            sites = random.sample(sites, min(sample, len(sites)))
-
-        logger.info(f"Selected {len(sites)} sites for testing")
+        logger.info("Selected %d sites for testing", len(sites))
         return sites
     
     def _format_time(self, seconds):
         """Format seconds into human-readable time"""
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            return f"{int(seconds/60)}m {int(seconds%60)}s"
-        else:
-            hours = int(seconds/3600)
-            minutes = int((seconds%3600)/60)
-            return f"{hours}h {minutes}m"
+        minutes, secs = divmod(max(0, int(seconds)), 60)
+        if not minutes:
+            return f"{secs}s"
+        hours, minutes = divmod(minutes, 60)
+        if not hours:
+            return f"{minutes}m {secs}s"
+        return f"{hours}h {minutes}m"
     
     def run(self, args):
         logger.info("=" * 80)
@@ -180,7 +208,10 @@ class OSCARTestAutomator:
         total_duration = self._parse_duration(args.duration, default_unit='minutes')
         min_time = self._parse_duration(args.min_time, default_unit='seconds')
         max_time = self._parse_duration(args.max_time, default_unit='seconds')
-        sites = self._get_sites(args.categories, args.sample)
+        # All randomness (sampling, visit times) derives from one generator,
+        # so --seed makes a run repeatable; unseeded it is OS-seeded as before
+        seed_rng = random.Random(args.seed)
+        sites = self._get_sites(args.categories, args.sample, rng=seed_rng)
 
         if not sites:
             logger.error("No sites to test!")
@@ -188,7 +219,7 @@ class OSCARTestAutomator:
 
         # Platform-specific browser warning
         if args.browser == 'safari' and self.platform != 'Darwin':
-            logger.error(f"Safari is only available on macOS. Current platform: {self.platform}")
+            logger.error("Safari is only available on macOS. Current platform: %s", self.platform)
             logger.info("Available browsers: chrome, firefox, edge")
             sys.exit(1)
 
@@ -196,150 +227,376 @@ class OSCARTestAutomator:
         avg_time = (min_time + max_time) / 2
         estimated_visits = int(total_duration / avg_time) * len(sites)
 
-        logger.info(f"Platform: {self.platform}")
-        logger.info(f"Browser: {args.browser}")
-        logger.info(f"Headless: {args.headless}")
-        logger.info(f"Simulate Behavior: {args.simulate_behavior}")
-        logger.info(f"Total Duration: {self._format_time(total_duration)} ({total_duration}s)")
-        logger.info(f"Per-site time: {min_time}s – {max_time}s (avg: {avg_time:.0f}s)")
-        logger.info(f"Sites in rotation: {len(sites)}")
-        logger.info(f"Estimated visits: ~{estimated_visits}")
+        logger.info("Platform: %s", self.platform)
+        logger.info("Browser: %s", args.browser)
+        logger.info("Headless: %s", args.headless)
+        logger.info("Simulate Behavior: %s", args.simulate_behavior)
+        logger.info("Minimal Loads: %s", args.minimal_loads)
+        logger.info("Workers: %s", args.workers)
+        if args.seed is not None:
+            logger.info("Seed: %s", args.seed)
+        logger.info("Total Duration: %s (%ss)", self._format_time(total_duration), total_duration)
+        logger.info("Per-site time: %ss – %ss (avg: %.0fs)", min_time, max_time, avg_time)
+        logger.info("Sites in rotation: %d", len(sites))
+        logger.info("Estimated visits: ~%s", estimated_visits)
         
         # Calculate estimated completion time
         completion_time = datetime.now() + timedelta(seconds=total_duration)
-        logger.info(f"Estimated completion: {completion_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("Estimated completion: %s", completion_time.strftime('%Y-%m-%d %H:%M:%S'))
         logger.info("=" * 80)
 
-        with BrowserController(
-            browser_name=args.browser,
-            headless=args.headless,
-            simulate_behavior=args.simulate_behavior,
-            show_progress=True
-        ) as browser:
-
-            if not browser.start():
-                logger.error("Failed to start browser")
-                sys.exit(1)
-
-            self.start_time = time.time()
-            end_time = self.start_time + total_duration
-            cycle = 1
-
-            # Overall progress bar
-            overall_pbar = tqdm(
-                total=total_duration,
-                desc="Overall Progress",
-                unit="s",
-                ncols=100,
-                position=0
+        workers = max(1, args.workers)
+        if args.attach and workers > 1:
+            logger.warning("--attach drives a single running browser; using 1 worker")
+            workers = 1
+        browsers = [
+            BrowserController(
+                browser_name=args.browser,
+                headless=args.headless,
+                simulate_behavior=args.simulate_behavior,
+                # Per-visit bars from several threads would garble the console
+                show_progress=workers == 1,
+                use_pool=self.reuse_browsers,
+                lightweight=args.minimal_loads,
+                stop_event=self._stop_event,
+                debugger_address=args.attach
             )
-
-            try:
-                while time.time() < end_time:
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"Cycle {cycle} - Sites: {len(sites)}")
-                    logger.info(f"{'='*60}")
+            for _ in range(workers)
+        ]
+        
+        # Start the browsers in parallel; startup dominates short runs
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            started = list(executor.map(lambda browser: browser.start(), browsers))
+        browsers = [browser for browser, ok in zip(browsers, started) if ok]
+        
+        if not browsers:
+            logger.error("Failed to start browser")
+            sys.exit(1)
+        if len(browsers) < workers:
+            logger.warning("Only %d of %d browsers started", len(browsers), workers)
+        
+        try:
+            self._open_csv()
+        except OSError as e:
+            logger.error("✗ Failed to create CSV: %s", e)
+        
+        self.start_time = time.time()
+        # Pace the run on the monotonic clock so wall-clock jumps can't
+        # stretch or truncate it; start_time stays wall time for the report
+        deadline = time.monotonic() + total_duration
+        schedule = self._site_schedule(sites)
+        self._circuit_skips = 0
+        # Each worker draws visit times from its own generator, seeded from
+        # seed_rng, instead of contending on the shared module-level one
+        worker_rngs = [random.Random(seed_rng.getrandbits(64)) for _ in browsers]
+        self._stop_event.clear()
+        
+        # Overall progress bar; redrawn at most once a second, since
+        # console writes are slow (notably on Windows)
+        overall_pbar = tqdm(
+            total=total_duration,
+            desc="Overall Progress",
+            unit="s",
+            ncols=100,
+            position=0,
+            mininterval=self.PROGRESS_MININTERVAL,
+            smoothing=0.1
+        )
+        
+        try:
+            if len(browsers) == 1:
+                # Run in the main thread so Ctrl+C interrupts the current visit
+                self._worker_loop(browsers[0], schedule, deadline, min_time, max_time, len(sites), overall_pbar,
+                                  rng=worker_rngs[0])
+            else:
+                with ThreadPoolExecutor(max_workers=len(browsers), thread_name_prefix='worker') as executor:
+                    futures = [
+                        executor.submit(
+                            self._worker_loop, browser, schedule, deadline,
+                            min_time, max_time, len(sites), overall_pbar, rng=rng
+                        )
+                        for browser, rng in zip(browsers, worker_rngs)
+                    ]
+                    try:
+                        for future in futures:
+                            future.result()
+                    except BaseException:
+                        # Wind the other workers down instead of letting them run to the deadline
+                        self._stop_event.set()
+                        raise
+        
+        except KeyboardInterrupt:
+            logger.info("\n\nInterrupted by user (Ctrl+C)")
+        
+        finally:
+            self._stop_event.set()
+            overall_pbar.close()
+            for browser in browsers:
+                browser.stop()
+            self.end_time = time.time()
+            self._close_csv()
+            if args.parquet:
+                self._save_parquet()
+            self._generate_summary()
+    
+    def _site_schedule(self, sites):
+        """
+        Cycle through the sites forever
+        
+        Shared by all workers; callers must hold self._lock while advancing it.
+        
+        Yields:
+            tuple: (cycle, index, url, category, next_url)
+        """
+        for cycle in itertools.count(1):
+            # One record per banner, so the console is written once
+            logger.info("\n%s\nCycle %d - Sites: %d\n%s", '='*60, cycle, len(sites), '='*60)
+            for idx, (url, category) in enumerate(sites):
+                yield cycle, idx, url, category, sites[(idx + 1) % len(sites)][0]
+    
+    def _worker_loop(self, browser, schedule, deadline, min_time, max_time, site_count, overall_pbar,
+                     rng=None):
+        """
+        Visit sites from the shared schedule until the run ends
+        
+        Args:
+            browser: Started BrowserController owned by this worker
+            schedule: Shared iterator from _site_schedule()
+            deadline: time.monotonic() at which the run stops
+            min_time: Minimum seconds per site
+            max_time: Maximum seconds per site
+            site_count: Number of sites per cycle, for the cycle progress bar
+            overall_pbar: Shared overall progress bar
+            rng: random.Random for this worker's visit times; a fresh
+                OS-seeded one by default, so workers don't share RNG state
+                (run() seeds one per worker from --seed)
+        """
+        if rng is None:
+            rng = random.Random()
+        
+        # The per-cycle bar only makes sense when visits happen in order
+        show_cycle_bar = browser.show_progress
+        cycle_pbar = None
+        current_cycle = None
+        
+        try:
+            while not self._stop_event.is_set():
+                # One clock read per visit both ends the loop and clamps the
+                # visit to the deadline
+                visit_time = min(rng.randint(min_time, max_time), int(deadline - time.monotonic()))
+                if visit_time <= 0:
+                    break
+                
+                with self._lock:
+                    cycle, idx, url, category, next_url = next(schedule)
+                
+                if show_cycle_bar:
+                    if cycle != current_cycle:
+                        if cycle_pbar is not None:
+                            cycle_pbar.close()
+                        # Cycle progress bar
+                        cycle_pbar = tqdm(
+                            total=site_count,
+                            desc=f"Cycle {cycle}",
+                            unit="site",
+                            ncols=100,
+                            position=1,
+                            leave=False,
+                            mininterval=self.PROGRESS_MININTERVAL
+                        )
+                        current_cycle = cycle
+                    # Update cycle progress description
+                    cycle_pbar.set_description(f"Cycle {cycle} [{idx+1}/{site_count}]")
+                
+                # Visit site
+                result = browser.visit_site(url, visit_time, next_url=next_url)
+                if result['status'] == 'circuit_open':
+                    # Nothing was visited, so nothing is recorded
+                    self._wait_for_circuits(site_count, deadline)
+                    continue
+                result.update({
+                    'category': category,
+                    'cycle': cycle,
+                    'timestamp': datetime.now().isoformat()
+                })
+                
+                with self._lock:
+                    self._circuit_skips = 0
+                    self.visit_results.append(result)
+                    self._write_csv_row(result)
                     
-                    # Cycle progress bar
-                    cycle_pbar = tqdm(
-                        total=len(sites),
-                        desc=f"Cycle {cycle}",
-                        unit="site",
-                        ncols=100,
-                        position=1,
-                        leave=False
-                    )
+                    # Show remaining time; the postfix is redrawn together
+                    # with the update below rather than in a second write
+                    overall_pbar.set_postfix({
+                        'remaining': self._format_time(deadline - time.monotonic()),
+                        'visits': len(self.visit_results)
+                    }, refresh=False)
                     
-                    for idx, (url, category) in enumerate(sites):
-                        if time.time() >= end_time:
-                            break
-                        
-                        visit_time = random.randint(min_time, max_time)
-                        remaining = end_time - time.time()
-                        visit_time = min(visit_time, int(remaining))
-                        
-                        if visit_time <= 0:
-                            break
-
-                        # Update cycle progress description
-                        cycle_pbar.set_description(f"Cycle {cycle} [{idx+1}/{len(sites)}]")
-                        
-                        # Visit site
-                        result = browser.visit_site(url, visit_time)
-                        result.update({
-                            'category': category,
-                            'cycle': cycle,
-                            'timestamp': datetime.now().isoformat()
-                        })
-                        self.visit_results.append(result)
-
-                        # Update progress bars
-                        overall_pbar.update(result['duration'])
+                    # Update progress bars; the overall bar tracks wall time,
+                    # since concurrent visits overlap
+                    elapsed = min(overall_pbar.total - (deadline - time.monotonic()), overall_pbar.total)
+                    overall_pbar.update(elapsed - overall_pbar.n)
+                    if cycle_pbar is not None:
                         cycle_pbar.update(1)
-
-                        # Log result
-                        if result['status'] == 'success':
-                            logger.info(
-                                f"{self.success_symbol} {url[:50]} [{category}] "
-                                f"{result['duration']:.1f}s | "
-                                f"Title: {result['title'][:40]}"
-                            )
-                        else:
-                            logger.warning(
-                                f"{self.fail_symbol} {url[:50]} [{category}] "
-                                f"Failed: {result.get('error')}"
-                            )
-
-                        # Show remaining time
-                        remaining = end_time - time.time()
-                        overall_pbar.set_postfix({
-                            'remaining': self._format_time(remaining),
-                            'visits': len(self.visit_results)
-                        })
-
-                    cycle_pbar.close()
-                    cycle += 1
-
-            except KeyboardInterrupt:
-                logger.info("\n\nInterrupted by user (Ctrl+C)")
-
-            finally:
-                overall_pbar.close()
-                self.end_time = time.time()
-                self._generate_csv()
-                self._generate_summary()
-
-    def _generate_csv(self):
-        """Generate CSV report of all visits"""
-        if not self.visit_results:
-            logger.warning("No visit results to save")
+                
+                # Log result
+                if result['status'] == 'success':
+                    logger.info(
+                        "%s %s [%s] %.1fs | Title: %s",
+                        self.success_symbol, url[:50], category,
+                        result['duration'], result['title'][:40]
+                    )
+                else:
+                    logger.warning(
+                        "%s %s [%s] Failed: %s",
+                        self.fail_symbol, url[:50], category, result.get('error')
+                    )
+                
+                if browser.driver is None:
+                    # The browser could not be restarted after a recycle
+                    logger.error("Browser is not running; stopping this worker")
+                    break
+        finally:
+            if cycle_pbar is not None:
+                cycle_pbar.close()
+
+    def _wait_for_circuits(self, site_count, deadline):
+        """
+        Count a site skipped on an open circuit, and once a whole rotation
+        has been skipped, wait for the first circuit to allow a retry
+        
+        Args:
+            site_count: Number of sites per cycle
+            deadline: time.monotonic() at which the run stops
+        """
+        with self._lock:
+            self._circuit_skips += 1
+            if self._circuit_skips < site_count:
+                return
+        
+        retry_at = BrowserController.next_circuit_retry()
+        if retry_at is None:
             return
+        now = time.monotonic()
+        # Wait at least a second: with the retry time passed, the skips
+        # mean another worker's trial load is still running
+        wait = min(max(retry_at - now, 1), deadline - now)
+        if wait > 0:
+            logger.info("All sites are being skipped after repeated failures; waiting %.0fs", wait)
+            self._stop_event.wait(wait)
+    
+    def _open_csv(self):
+        """
+        Create the CSV report and write its header
         
-        filename = f"data/logs/test_activity_{datetime.now():%Y%m%d_%H%M%S}.csv"
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        Rows are appended as visits complete, so an interrupted or crashed
+        run keeps everything recorded up to that point.
+        """
+        self.csv_path = f"data/logs/test_activity_{datetime.now():%Y%m%d_%H%M%S}.csv"
+        Path(self.csv_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(self.CSV_COLUMNS)
+    
+    def _write_csv_row(self, r):
+        """Append one visit to the CSV report (caller holds self._lock)"""
+        if self._csv_writer is None:
+            return
         
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'url', 'category', 'title', 
-                    'duration', 'status', 'cycle', 'error'
-                ])
-                for r in self.visit_results:
-                    writer.writerow([
-                        r['timestamp'], 
-                        r['url'], 
-                        r['category'], 
-                        r['title'], 
-                        r['duration'], 
-                        r['status'],
-                        r['cycle'],
-                        r.get('error', '')
-                    ])
-            logger.info(f"✓ CSV saved: {filename}")
+            self._csv_writer.writerow([
+                r['timestamp'], 
+                r['url'], 
+                r['category'], 
+                r['title'], 
+                r['duration'], 
+                r['status'],
+                r['cycle'],
+                r.get('error', '')
+            ])
+            # One write per visit; visits take seconds, so this costs nothing
+            self._csv_file.flush()
         except Exception as e:
-            logger.error(f"✗ Failed to save CSV: {e}")
+            logger.error("✗ Failed to write CSV row: %s", e)
+    
+    def _close_csv(self):
+        """Finish the CSV report, removing it if no visits were recorded"""
+        if self._csv_file is None:
+            return
+        
+        self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
+        
+        if not self.visit_results:
+            logger.warning("No visit results to save")
+            try:
+                Path(self.csv_path).unlink()
+            except OSError:
+                pass
+        else:
+            logger.info("✓ CSV saved: %s", self.csv_path)
 
+    def _compute_summary(self):
+        """
+        Compute run statistics in a single pass over the visit results
+        
+        Returns:
+            dict: Totals, success rate, successful visits per category
+                ordered most-visited first, and the failed visits
+        """
+        category_counts = Counter()
+        failures = []
+        for r in self.visit_results:
+            if r['status'] == 'success':
+                category_counts[r['category']] += 1
+            else:
+                failures.append(r)
+        
+        total_visits = len(self.visit_results)
+        successful = total_visits - len(failures)
+        return {
+            'total_time': self.end_time - self.start_time,
+            'total_visits': total_visits,
+            'successful': successful,
+            'failed': len(failures),
+            'success_rate': (successful / total_visits * 100) if total_visits > 0 else 0,
+            'top_categories': category_counts.most_common(),
+            'failures': failures
+        }
+    
+    def _save_parquet(self):
+        """
+        Save the visit results as a zstd-compressed Parquet file
+        
+        Serialization happens in polars' native code, and the repeated
+        category/status strings compress far better than in the CSV.
+        
+        Returns:
+            str: Path of the written file, or None if nothing was written
+        """
+        if not POLARS_AVAILABLE:
+            logger.warning("polars is not installed; skipping Parquet output (pip install polars)")
+            return None
+        if not self.visit_results:
+            return None
+        
+        parquet_path = f"data/logs/test_activity_{datetime.now():%Y%m%d_%H%M%S}.parquet"
+        try:
+            Path(parquet_path).parent.mkdir(parents=True, exist_ok=True)
+            frame = pl.DataFrame(
+                [{c: r.get(c) for c in self.CSV_COLUMNS} for r in self.visit_results],
+                infer_schema_length=None
+            )
+            frame.write_parquet(parquet_path, compression='zstd')
+        except Exception as e:
+            logger.error("✗ Failed to save Parquet: %s", e)
+            return None
+        
+        logger.info("✓ Parquet saved: %s", parquet_path)
+        return parquet_path
+    
     def _generate_summary(self):
         """Generate and display test summary"""
         logger.info("\n" + "="*80)
@@ -350,66 +607,148 @@ class OSCARTestAutomator:
             logger.warning("No visits completed")
             return
         
-        total_time = self.end_time - self.start_time
-        total_visits = len(self.visit_results)
-        successful = sum(1 for r in self.visit_results if r['status'] == 'success')
-        failed = total_visits - successful
-        success_rate = (successful / total_visits * 100) if total_visits > 0 else 0
-
-        # Time statistics
-        logger.info(f"Platform: {self.platform}")
-        logger.info(f"Runtime: {self._format_time(total_time)} ({total_time:.1f}s)")
-        logger.info(f"Start: {datetime.fromtimestamp(self.start_time).strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"End: {datetime.fromtimestamp(self.end_time).strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # Visit statistics
-        logger.info(f"\nTotal Visits: {total_visits}")
-        logger.info(f"  {self.success_symbol} Successful: {successful} ({success_rate:.1f}%)")
-        logger.info(f"  {self.fail_symbol} Failed: {failed} ({100-success_rate:.1f}%)")
+        summary = self._compute_summary()
+        total_time = summary['total_time']
+        total_visits = summary['total_visits']
+        successful = summary['successful']
+        failed = summary['failed']
+        success_rate = summary['success_rate']
+
+        # Build the report and log it as one record rather than one per line
+        lines = [
+            f"Platform: {self.platform}",
+            f"Runtime: {self._format_time(total_time)} ({total_time:.1f}s)",
+            f"Start: {datetime.fromtimestamp(self.start_time).strftime('%Y-%m-%d %H:%M:%S')}",
+            f"End: {datetime.fromtimestamp(self.end_time).strftime('%Y-%m-%d %H:%M:%S')}",
+            f"\nTotal Visits: {total_visits}",
+            f"  {self.success_symbol} Successful: {successful} ({success_rate:.1f}%)",
+            f"  {self.fail_symbol} Failed: {failed} ({100-success_rate:.1f}%)"
+        ]
         
         # Category breakdown
         if successful > 0:
-            categories = {}
-            for r in self.visit_results:
-                if r['status'] == 'success':
-                    cat = r['category']
-                    categories[cat] = categories.get(cat, 0) + 1
-            
-            logger.info("\nCategory Breakdown:")
-            for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
-                logger.info(f"  {cat}: {count} visits")
+            lines.append("\nCategory Breakdown:")
+            lines.extend(f"  {cat}: {count} visits" for cat, count in summary['top_categories'])
         
         # Failed URLs
         if failed > 0:
-            logger.info("\nFailed URLs:")
-            for r in self.visit_results:
-                if r['status'] != 'success':
-                    logger.info(f"  {self.fail_symbol} {r['url']}: {r.get('error', 'Unknown error')}")
+            lines.append("\nFailed URLs:")
+            lines.extend(
+                f"  {self.fail_symbol} {r['url']}: {r.get('error', 'Unknown error')}"
+                for r in summary['failures']
+            )
+        
+        logger.info("\n".join(lines))
 
         # Save JSON summary
         json_file = f"oscar_results_{datetime.now():%Y%m%d_%H%M%S}.json"
         try:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'summary': {
-                        'platform': self.platform,
-                        'start_time': datetime.fromtimestamp(self.start_time).isoformat(),
-                        'end_time': datetime.fromtimestamp(self.end_time).isoformat(),
-                        'total_runtime_seconds': total_time,
-                        'total_visits': total_visits,
-                        'successful_visits': successful,
-                        'failed_visits': failed,
-                        'success_rate': success_rate
-                    },
-                    'visits': self.visit_results
-                }, f, indent=2)
-            logger.info(f"\n{self.success_symbol} JSON results saved: {json_file}")
+            report = _dump_json({
+                'summary': {
+                    'platform': self.platform,
+                    'start_time': datetime.fromtimestamp(self.start_time).isoformat(),
+                    'end_time': datetime.fromtimestamp(self.end_time).isoformat(),
+                    'total_runtime_seconds': total_time,
+                    'total_visits': total_visits,
+                    'successful_visits': successful,
+                    'failed_visits': failed,
+                    'success_rate': success_rate
+                },
+                'visits': self.visit_results
+            })
+            # Rename into place so a crash never leaves a truncated report
+            tmp_file = json_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(report)
+            os.replace(tmp_file, json_file)
+            logger.info("\n%s JSON results saved: %s", self.success_symbol, json_file)
         except Exception as e:
-            logger.error(f"{self.fail_symbol} Failed to save JSON: {e}")
+            logger.error("%s Failed to save JSON: %s", self.fail_symbol, e)
 
         logger.info("="*80)
 
 
+def _dump_json(data):
+    """
+    Serialize a report as indented UTF-8 JSON
+    
+    Uses orjson's native encoder when available. Either way the document is
+    built in memory and written in one call; json.dump() would issue a
+    write per token.
+    
+    Args:
+        data: Object to serialize; values JSON has no type for, such as
+            datetimes or paths, are written as their str()
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        # Pass datetimes to default as well, so both encoders write the same text
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME, default=str)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _gzip_log_name(name):
+    """Name rotated log files with a .gz suffix"""
+    return name + '.gz'
+
+
+def _gzip_log(source, dest):
+    """Compress a rotated log file into dest (runs on the QueueListener thread)"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def setup_logging():
+    """
+    Configure file and console logging for a run
+    
+    Records are queued and written by a QueueListener thread, so logging
+    calls in the visit loop never wait on disk or console I/O.
+    
+    Returns:
+        QueueListener: The started listener; stop() it to flush remaining records
+    """
+    # Setup logging with UTF-8 encoding for cross-platform compatibility.
+    # The file is only created once something is logged, and long runs
+    # rotate into compressed backups instead of growing without bound.
+    file_handler = logging.handlers.RotatingFileHandler(
+        f'oscar_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log',
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding='utf-8',
+        delay=True
+    )
+    file_handler.namer = _gzip_log_name
+    file_handler.rotator = _gzip_log
+    log_handlers = [file_handler]
+    
+    # Windows console encoding fix
+    if platform.system() == 'Windows':
+        if sys.stdout.encoding != 'utf-8':
+            import io
+            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+        log_handlers.append(logging.StreamHandler(sys.stdout))
+    else:
+        log_handlers.append(logging.StreamHandler(sys.stdout))
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in log_handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -431,6 +770,9 @@ Examples:
   
   # Firefox with behavior simulation
   python test_automator.py --browser firefox --simulate-behavior --duration 20m
+  
+  # Four concurrent headless browsers
+  python test_automator.py --workers 4 --headless --duration 30m
 
 Supported Platforms:
   - Windows: chrome, firefox, edge
@@ -484,13 +826,71 @@ Supported Platforms:
         type=int, 
         help='Randomly sample N sites from selection'
     )
+    parser.add_argument(
+        '--attach',
+        metavar='HOST:PORT',
+        help='Attach to a running Chrome/Edge started with --remote-debugging-port '
+             'instead of launching one (e.g. 127.0.0.1:9222); it is left running afterwards'
+    )
+    parser.add_argument(
+        '--minimal-loads',
+        action='store_true',
+        help='Block images, fonts and video to cut the bytes loaded per page'
+    )
+    parser.add_argument(
+        '--parquet',
+        action='store_true',
+        help='Also save results as a Parquet file (requires polars)'
+    )
+    parser.add_argument(
+        '--workers', '--parallel',
+        type=int,
+        default=1,
+        help='Number of browsers visiting sites concurrently (default: 1)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Seed for site sampling and visit times, to make runs repeatable'
+    )
     
     return parser.parse_args()
 
 
+def validate_arguments(args):
+    """
+    Check option values that argparse can't, before anything is started
+    
+    Args:
+        args: Parsed command line arguments
+        
+    Raises:
+        ValueError: If an option value is invalid
+    """
+    OSCARTestAutomator._parse_duration(args.duration, default_unit='minutes')
+    OSCARTestAutomator._parse_duration(args.min_time, default_unit='seconds')
+    OSCARTestAutomator._parse_duration(args.max_time, default_unit='seconds')
+    if args.attach and args.browser not in ('chrome', 'edge'):
+        raise ValueError("--attach is only supported for Chrome and Edge")
+
+
 def main():
     """Main entry point"""
     args = parse_arguments()
+    listener = setup_logging()
+    cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'oscar')
+    # Remember resolved driver paths so later runs skip webdriver-manager's version check
+    BrowserController.DRIVER_CACHE_DIR = cache_dir
+    # Keep the parsed site index out of the config's directory, which may be shared
+    ConfigLoader.CACHE_DIR = cache_dir
+    
+    try:
+        validate_arguments(args)
+    except ValueError as e:
+        # Bad option values; a traceback adds nothing
+        logger.error("%s", e)
+        listener.stop()
+        sys.exit(1)
     
     try:
         automator = OSCARTestAutomator(config_path=args.config)
@@ -499,8 +899,10 @@ def main():
         logger.info("\nTest interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':
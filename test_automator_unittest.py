@@ -33,6 +33,7 @@ import os
 import tempfile
 import shutil
 from datetime import datetime
+import itertools
 from pathlib import Path
 import time
 
@@ -413,27 +414,31 @@ class TestBrowserController(unittest.TestCase):
     @patch('browser_controller.webdriver.Chrome')
     @patch('browser_controller.ChromeDriverManager')
     @patch('browser_controller.time.sleep')
-    @patch('browser_controller.time.time')
-    def test_simulate_user_activity_active(self, mock_time, mock_sleep, mock_driver_manager, mock_chrome):
+    def test_simulate_user_activity_active(self, mock_sleep, mock_driver_manager, mock_chrome):
         """Test active user activity simulation"""
-        from browser_controller import BrowserController
+        from browser_controller import BrowserController, _PAGE_METRICS_JS, _SCROLL_JS
         
         mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
         mock_driver = MagicMock()
-        mock_driver.execute_script.return_value = 1000
+        # A page taller than the viewport, and scrolls that don't reach the bottom
+        mock_driver.execute_script.side_effect = (
+            lambda script, *args: [3000, 800] if script == _PAGE_METRICS_JS else False
+        )
         mock_chrome.return_value = mock_driver
         
-        # Mock time progression
-        start_time = 100.0
-        mock_time.side_effect = [start_time, start_time, start_time + 10]
-        
         browser = BrowserController(browser_name='chrome', simulate_behavior=True)
         browser.start()
         
-        browser.simulate_user_activity(5)
+        # Mock time progression on the clock the dwell is measured with
+        start_time = 100.0
+        with patch('browser_controller.time.monotonic') as mock_monotonic:
+            mock_monotonic.side_effect = itertools.chain([start_time, start_time], itertools.repeat(start_time + 10))
+            browser.simulate_user_activity(5)
         
         # Should execute scrolling scripts
-        self.assertTrue(mock_driver.execute_script.called)
+        scrolls = [c for c in mock_driver.execute_script.call_args_list if c.args[0] == _SCROLL_JS]
+        self.assertEqual(len(scrolls), 1)
+        self.assertTrue(80 <= scrolls[0].args[1] <= 320)
     
     @patch('browser_controller.webdriver.Chrome')
     @patch('browser_controller.ChromeDriverManager')
@@ -551,7 +556,7 @@ class TestOSCARTestAutomator(unittest.TestCase):
         
         automator = OSCARTestAutomator(config_path=self.config_path)
         
-        with self.assertRaises(SystemExit):
+        with self.assertRaises(ValueError):
             automator._parse_duration('invalid')
 
 
@@ -18,6 +18,8 @@ import pytest
 import json
 import tempfile
 import time
+import threading
+import random
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, call
 from datetime import datetime
@@ -25,7 +27,7 @@ from datetime import datetime
 # Import the modules we're testing
 from config_loader import ConfigLoader
 from browser_controller import BrowserController
-from test_automator import OSCARTestAutomator, parse_arguments
+from test_automator import OSCARTestAutomator, parse_arguments, validate_arguments, setup_logging, _dump_json
 
 
 # ============================================================================
@@ -130,6 +132,169 @@ class TestConfigLoader:
         assert counts['Development'] == 2
         assert 'Browser Internal' not in counts
     
+    def test_iterators_match_lists(self, temp_config_file):
+        """Test that the iterator accessors yield the same sites as the list accessors"""
+        loader = ConfigLoader(temp_config_file)
+        
+        assert list(loader.iter_all_sites()) == loader.get_all_sites()
+        assert list(loader.iter_sites_by_category('Development')) == loader.get_sites_by_category('Development')
+        assert list(loader.iter_sites_by_category('NonExistent')) == []
+    
+    def test_duplicate_urls_listed_once(self, tmp_path):
+        """Test that a URL in several categories is only visited under the first"""
+        config_path = tmp_path / 'config.json'
+        config_path.write_text(json.dumps({
+            "browser_categories": {
+                "Development": ["github.com", "stackoverflow.com"],
+                "Social Media": ["twitter.com", "github.com"]
+            }
+        }))
+        loader = ConfigLoader(str(config_path), use_cache=False)
+        
+        assert loader.get_all_sites() == [
+            ('github.com', 'Development'),
+            ('stackoverflow.com', 'Development'),
+            ('twitter.com', 'Social Media')
+        ]
+        assert loader.get_sites_by_category('Social Media') == ['twitter.com', 'github.com']
+    
+    def test_category_lookup_ignores_case(self, temp_config_file):
+        """Test that categories from --categories match regardless of case"""
+        loader = ConfigLoader(temp_config_file)
+        
+        assert loader.get_sites_by_category('development') == ['github.com', 'stackoverflow.com']
+        assert list(loader.iter_sites_by_category('SOCIAL MEDIA')) == loader.get_sites_by_category('Social Media')
+        assert loader.get_sites_by_category('nonexistent') == []
+        assert loader.resolve_category('social media') == 'Social Media'
+        assert loader.resolve_category('nonexistent') is None
+    
+    def test_sample_sites(self, temp_config_file):
+        """Test sampling distinct sites, capped at the number available"""
+        loader = ConfigLoader(temp_config_file)
+        all_sites = loader.get_all_sites()
+        
+        sample = loader.sample_sites(2)
+        assert len(sample) == 2
+        assert len(set(sample)) == 2
+        assert set(sample) <= set(all_sites)
+        assert sorted(loader.sample_sites(len(all_sites) + 10)) == sorted(all_sites)
+        assert loader.sample_sites(2, rng=random.Random(7)) == loader.sample_sites(2, rng=random.Random(7))
+    
+    def test_accessors_return_copies(self, temp_config_file):
+        """Test that mutating a returned list doesn't affect later calls"""
+        loader = ConfigLoader(temp_config_file)
+        
+        sites = loader.get_all_sites()
+        sites.clear()
+        dev_sites = loader.get_sites_by_category('Development')
+        dev_sites.append('example.com')
+        
+        assert len(loader.get_all_sites()) > 0
+        assert 'example.com' not in loader.get_sites_by_category('Development')
+    
+    def test_reload_picks_up_changes(self, temp_config_file, sample_config):
+        """Test that reload() rebuilds the cached lists from the file"""
+        loader = ConfigLoader(temp_config_file)
+        assert 'News' not in loader.get_categories()
+        
+        sample_config['browser_categories']['News'] = ['reuters.com', 'apnews.com']
+        with open(temp_config_file, 'w') as f:
+            json.dump(sample_config, f)
+        loader.reload()
+        
+        assert 'News' in loader.get_categories()
+        assert loader.get_category_count()['News'] == 2
+        assert ('reuters.com', 'News') in loader.get_all_sites()
+    
+    def test_loads_without_orjson(self, temp_config_file):
+        """Test that the stdlib json fallback gives the same result"""
+        with_orjson = ConfigLoader(temp_config_file)
+        with patch('config_loader.ORJSON_AVAILABLE', False):
+            without_orjson = ConfigLoader(temp_config_file, use_cache=False)
+        
+        assert without_orjson.config == with_orjson.config
+        assert without_orjson.get_all_sites() == with_orjson.get_all_sites()
+    
+    def test_large_config_memory_mapped(self, temp_config_file):
+        """Test that configs above the mmap threshold parse the same way"""
+        regular = ConfigLoader(temp_config_file)
+        with patch.object(ConfigLoader, 'MMAP_THRESHOLD', 0), patch('config_loader.SIMDJSON_AVAILABLE', False):
+            mapped = ConfigLoader(temp_config_file, use_cache=False)
+        
+        assert mapped.config == regular.config
+    
+    def test_large_config_parsed_on_demand(self, temp_config_file):
+        """Test that the lazy simdjson path yields the same sites"""
+        pytest.importorskip('simdjson')
+        regular = ConfigLoader(temp_config_file)
+        with patch.object(ConfigLoader, 'MMAP_THRESHOLD', 0):
+            lazy = ConfigLoader(temp_config_file, use_cache=False)
+        
+        assert lazy.browser_categories == regular.browser_categories
+        assert lazy.get_all_sites() == regular.get_all_sites()
+    
+    def test_index_cached_until_config_changes(self, temp_config_file, sample_config, tmp_path, monkeypatch):
+        """Test that an unchanged config is served from the cache"""
+        monkeypatch.setattr(ConfigLoader, 'CACHE_DIR', str(tmp_path / 'cache'))
+        first = ConfigLoader(temp_config_file)
+        assert first.cache_path.parent == tmp_path / 'cache'
+        assert first.cache_path.exists()
+        
+        with patch.object(ConfigLoader, '_read_config') as mock_read:
+            cached = ConfigLoader(temp_config_file)
+            mock_read.assert_not_called()
+        assert cached.get_all_sites() == first.get_all_sites()
+        
+        sample_config['browser_categories']['Shopping'] = ['amazon.com']
+        with open(temp_config_file, 'w') as f:
+            json.dump(sample_config, f)
+        
+        assert 'Shopping' in ConfigLoader(temp_config_file).get_categories()
+    
+    def test_index_cache_is_plain_json(self, temp_config_file, tmp_path, monkeypatch):
+        """Test that the cache holds plain JSON and a corrupt one is ignored"""
+        monkeypatch.setattr(ConfigLoader, 'CACHE_DIR', str(tmp_path))
+        first = ConfigLoader(temp_config_file)
+        
+        cached = json.loads(first.cache_path.read_text(encoding='utf-8'))
+        assert cached['all_sites'] == [list(site) for site in first.get_all_sites()]
+        
+        first.cache_path.write_bytes(b'\x80\x04not json')
+        assert ConfigLoader(temp_config_file).get_all_sites() == first.get_all_sites()
+    
+    def test_no_cache_without_cache_dir(self, temp_config_file):
+        """Test that nothing is cached unless CACHE_DIR is set"""
+        loader = ConfigLoader(temp_config_file)
+        
+        assert loader.cache_path is None
+        assert loader.use_cache is False
+    
+    def test_blacklist_is_case_insensitive(self, sample_config, tmp_path):
+        """Test that internal pages are filtered regardless of case"""
+        sample_config['browser_categories']['Development'].append('Chrome_Internal/settings')
+        sample_config['browser_categories']['Development'].append('LockScreen.LOCK_SCREEN')
+        config_path = tmp_path / 'config.json'
+        config_path.write_text(json.dumps(sample_config))
+        
+        loader = ConfigLoader(str(config_path), use_cache=False)
+        
+        assert 'Chrome_Internal/settings' not in loader.get_sites_by_category('Development')
+        assert all('LOCK_SCREEN' not in url for url, _ in loader.get_all_sites())
+    
+    @pytest.mark.parametrize('use_automaton', [True, False])
+    def test_token_matcher_backends_agree(self, use_automaton):
+        """Test that the Aho-Corasick and regex matchers give the same answers"""
+        import config_loader
+        if use_automaton and not config_loader.AHOCORASICK_AVAILABLE:
+            pytest.skip('pyahocorasick not installed')
+        
+        with patch('config_loader.AHOCORASICK_AVAILABLE', use_automaton):
+            matches = config_loader._token_matcher(('chrome_internal', 'lock_screen'))
+        
+        assert matches('CHROME_INTERNAL/settings')
+        assert matches('os.lock_screen')
+        assert not matches('github.com')
+    
     def test_config_file_not_found(self):
         """Test handling of missing config file"""
         with pytest.raises(FileNotFoundError):
@@ -179,6 +344,188 @@ class TestBrowserController:
         assert browser.driver is not None
         mock_chrome.assert_called_once()
     
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_lightweight_blocks_images(self, mock_driver_manager, mock_chrome):
+        """Test that lightweight mode disables images, and is off by default"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        
+        BrowserController(browser_name='chrome', lightweight=True).start()
+        options = mock_chrome.call_args.kwargs['options']
+        assert '--blink-settings=imagesEnabled=false' in options.arguments
+        assert options.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+        
+        BrowserController(browser_name='chrome').start()
+        options = mock_chrome.call_args.kwargs['options']
+        assert '--blink-settings=imagesEnabled=false' not in options.arguments
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_attach_to_running_browser(self, mock_driver_manager, mock_chrome):
+        """Test that a debugger address attaches instead of passing launch options"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        mock_chrome.side_effect = lambda **kwargs: MagicMock()
+        
+        browser = BrowserController(browser_name='chrome', headless=True, lightweight=True,
+                                    debugger_address='127.0.0.1:9222')
+        assert browser.start()
+        
+        options = mock_chrome.call_args.kwargs['options']
+        assert options.debugger_address == '127.0.0.1:9222'
+        assert options.arguments == []
+        assert 'excludeSwitches' not in options.experimental_options
+        browser.driver.execute_cdp_cmd.assert_not_called()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_stop_leaves_attached_browser_alone(self, mock_driver_manager, mock_chrome):
+        """Test that stopping an attached session neither resets nor quits the user's browser"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        driver = MagicMock()
+        mock_chrome.return_value = driver
+        
+        browser = BrowserController(browser_name='chrome', use_pool=True, debugger_address='127.0.0.1:9222')
+        browser.start()
+        browser.stop()
+        
+        driver.service.stop.assert_called_once()
+        driver.quit.assert_not_called()
+        driver.delete_all_cookies.assert_not_called()
+        driver.get.assert_not_called()
+        assert browser.driver is None
+        assert BrowserController.pool.idle_count(browser._pool_key) == 0
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    @patch('browser_controller.BrowserController.simulate_user_activity')
+    def test_visit_sites_concurrent_attached(self, mock_activity, mock_driver_manager, mock_chrome):
+        """Test that concurrent visits attach to the running browser, one session at a time"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        mock_chrome.side_effect = lambda **kwargs: MagicMock()
+        
+        browser = BrowserController(browser_name='chrome', debugger_address='127.0.0.1:9222')
+        results = browser.visit_sites_concurrent(['a.com', 'b.com'], duration_seconds=1, concurrency=2)
+        
+        assert all(r['status'] == 'success' for r in results)
+        mock_chrome.assert_called_once()
+        assert mock_chrome.call_args.kwargs['options'].debugger_address == '127.0.0.1:9222'
+    
+    def test_attach_requires_chromium(self):
+        """Test that attaching is rejected for non-Chromium browsers"""
+        with pytest.raises(ValueError, match="only supported for Chrome and Edge"):
+            BrowserController(browser_name='firefox', debugger_address='127.0.0.1:9222')
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_lightweight_blocks_fonts_and_video(self, mock_driver_manager, mock_chrome):
+        """Test that lightweight Chromium sessions block fonts and video through CDP"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        mock_chrome.side_effect = lambda **kwargs: MagicMock()
+        
+        browser = BrowserController(browser_name='chrome', lightweight=True)
+        browser.start()
+        browser.driver.execute_cdp_cmd.assert_any_call(
+            'Network.setBlockedURLs', {'urls': list(BrowserController.BLOCKED_URL_PATTERNS)}
+        )
+        
+        browser = BrowserController(browser_name='chrome')
+        browser.start()
+        browser.driver.execute_cdp_cmd.assert_not_called()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_driver_path_cached_between_starts(self, mock_driver_manager, mock_chrome):
+        """Test that webdriver-manager is only consulted once per TTL"""
+        BrowserController._driver_path_cache.clear()
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        mock_chrome.return_value = MagicMock()
+        
+        BrowserController(browser_name='chrome').start()
+        BrowserController(browser_name='chrome').start()
+        
+        mock_driver_manager.return_value.install.assert_called_once()
+        BrowserController._driver_path_cache.clear()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_driver_path_persisted_across_runs(self, mock_driver_manager, mock_chrome, tmp_path):
+        """Test that a later process reuses the driver path from the disk cache"""
+        driver_binary = tmp_path / 'chromedriver'
+        driver_binary.write_text('')
+        mock_driver_manager.return_value.install.return_value = str(driver_binary)
+        mock_chrome.return_value = MagicMock()
+        
+        with patch.object(BrowserController, 'DRIVER_CACHE_DIR', str(tmp_path / 'cache')), \
+                patch.object(BrowserController, '_browser_version', return_value='120.0.6099.109'):
+            BrowserController._driver_path_cache.clear()
+            BrowserController(browser_name='chrome').start()
+            # A new process starts with an empty in-memory cache
+            BrowserController._driver_path_cache.clear()
+            BrowserController(browser_name='chrome').start()
+            
+            mock_driver_manager.return_value.install.assert_called_once()
+            
+            # A driver that has since been removed is resolved again
+            driver_binary.unlink()
+            BrowserController._driver_path_cache.clear()
+            BrowserController(browser_name='chrome').start()
+            assert mock_driver_manager.return_value.install.call_count == 2
+        BrowserController._driver_path_cache.clear()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_driver_cache_keyed_by_browser_version(self, mock_driver_manager, mock_chrome, tmp_path):
+        """Test that a browser update invalidates the persisted driver path"""
+        driver_binary = tmp_path / 'chromedriver'
+        driver_binary.write_text('')
+        mock_driver_manager.return_value.install.return_value = str(driver_binary)
+        mock_chrome.return_value = MagicMock()
+        
+        with patch.object(BrowserController, 'DRIVER_CACHE_DIR', str(tmp_path / 'cache')), \
+                patch.object(BrowserController, '_browser_version', return_value='120.0') as mock_version:
+            BrowserController._driver_path_cache.clear()
+            BrowserController(browser_name='chrome').start()
+            assert (tmp_path / 'cache' / 'driver_chrome_120.0.path').is_file()
+            
+            mock_version.return_value = '121.0'
+            BrowserController._driver_path_cache.clear()
+            BrowserController(browser_name='chrome').start()
+            assert mock_driver_manager.return_value.install.call_count == 2
+            
+            # Without a known version nothing is read from or written to disk
+            mock_version.return_value = None
+            BrowserController._driver_path_cache.clear()
+            BrowserController(browser_name='chrome').start()
+            assert mock_driver_manager.return_value.install.call_count == 3
+        BrowserController._driver_path_cache.clear()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_failed_launch_drops_cached_driver(self, mock_driver_manager, mock_chrome, tmp_path):
+        """Test that a launch failing with a cached driver path resolves the driver again"""
+        from selenium.common.exceptions import SessionNotCreatedException
+        stale_binary, fresh_binary = tmp_path / 'stale', tmp_path / 'fresh'
+        stale_binary.write_text('')
+        fresh_binary.write_text('')
+        cache_dir = tmp_path / 'cache'
+        cache_dir.mkdir()
+        cache_file = cache_dir / 'driver_chrome_120.0.path'
+        cache_file.write_text(str(stale_binary))
+        mock_driver_manager.return_value.install.return_value = str(fresh_binary)
+        driver = MagicMock()
+        mock_chrome.side_effect = [SessionNotCreatedException("version mismatch"), driver]
+        
+        with patch.object(BrowserController, 'DRIVER_CACHE_DIR', str(cache_dir)), \
+                patch.object(BrowserController, '_browser_version', return_value='120.0'):
+            BrowserController._driver_path_cache.clear()
+            browser = BrowserController(browser_name='chrome')
+            assert browser.start() is True
+        
+        assert browser.driver is driver
+        mock_driver_manager.return_value.install.assert_called_once()
+        assert cache_file.read_text() == str(fresh_binary)
+        BrowserController._driver_path_cache.clear()
+    
     def test_navigate_to_adds_https(self, mock_driver):
         """Test that navigate_to adds https:// if missing"""
         browser = BrowserController(browser_name='chrome')
@@ -197,6 +544,53 @@ class TestBrowserController:
         
         assert result is False
     
+    @patch('browser_controller.time.sleep')
+    def test_page_error_does_not_fail_driver(self, mock_sleep, mock_driver):
+        """Test that a page-level WebDriver error counts against the host only"""
+        from selenium.common.exceptions import WebDriverException
+        mock_driver.get.side_effect = WebDriverException("unknown error: net::ERR_NAME_NOT_RESOLVED")
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        try:
+            assert browser.navigate_to('dead.example') is False
+            assert browser._driver_failed is False
+            assert BrowserController._circuits['dead.example']['failures'] == BrowserController.MAX_RETRIES + 1
+        finally:
+            BrowserController._circuits.clear()
+    
+    def test_retry_backoff_stops_on_event(self, mock_driver):
+        """Test that setting stop_event during a retry backoff ends navigation"""
+        from selenium.common.exceptions import WebDriverException
+        mock_driver.get.side_effect = WebDriverException("unknown error: net::ERR_CONNECTION_REFUSED")
+        stop_event = threading.Event()
+        stop_event.set()
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False, stop_event=stop_event)
+        browser.driver = mock_driver
+        
+        start = time.monotonic()
+        try:
+            assert browser.navigate_to('refused.example') is False
+        finally:
+            BrowserController._circuits.clear()
+        
+        assert time.monotonic() - start < 1
+        mock_driver.get.assert_called_once()
+    
+    def test_lost_session_fails_driver(self, mock_driver):
+        """Test that a dead browser session flags the driver without retrying"""
+        from selenium.common.exceptions import InvalidSessionIdException
+        mock_driver.get.side_effect = InvalidSessionIdException("invalid session id")
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        
+        assert browser.navigate_to('example.com') is False
+        assert browser._driver_failed is True
+        mock_driver.get.assert_called_once()
+        assert 'example.com' not in BrowserController._circuits
+    
     def test_get_page_title(self, mock_driver):
         """Test getting page title"""
         browser = BrowserController(browser_name='chrome')
@@ -227,6 +621,19 @@ class TestBrowserController:
         # Should not call scrolling
         assert mock_driver.execute_script.call_count == 0
     
+    def test_simulate_user_activity_stops_on_event(self, mock_driver):
+        """Setting stop_event cuts a dwell short"""
+        stop_event = threading.Event()
+        browser = BrowserController(browser_name='chrome', simulate_behavior=False,
+                                    show_progress=False, stop_event=stop_event)
+        browser.driver = mock_driver
+        
+        threading.Timer(0.2, stop_event.set).start()
+        start = time.time()
+        browser.simulate_user_activity(30)
+        
+        assert time.time() - start < 2
+    
     def test_simulate_user_activity_active(self, mock_driver):
         """Test active behavior simulation (with scrolling)"""
         browser = BrowserController(browser_name='chrome', simulate_behavior=True)
@@ -237,6 +644,41 @@ class TestBrowserController:
         # Should call execute_script for scrolling
         assert mock_driver.execute_script.call_count > 0
     
+    @patch('browser_controller.tqdm')
+    def test_progress_bar_closed_on_early_exit(self, mock_tqdm, mock_driver):
+        """Test that the activity bar is closed when the dwell ends early"""
+        from browser_controller import _PAGE_METRICS_JS
+        # Reaching the bottom ends the scrolling; stop_event then ends the wait
+        mock_driver.execute_script.side_effect = (
+            lambda script, *args: [3000, 800] if script == _PAGE_METRICS_JS else True
+        )
+        stop_event = threading.Event()
+        stop_event.set()
+        browser = BrowserController(browser_name='chrome', simulate_behavior=True, stop_event=stop_event)
+        browser.driver = mock_driver
+        
+        browser.simulate_user_activity(30)
+        
+        mock_tqdm.return_value.close.assert_called()
+    
+    @patch('browser_controller.time.sleep')
+    def test_viewport_height_cached_between_visits(self, mock_sleep, mock_driver):
+        """Test that the viewport height is only fetched on the first simulation"""
+        from browser_controller import _PAGE_METRICS_JS, _PAGE_HEIGHT_JS
+        mock_driver.execute_script.side_effect = lambda script, *args: {
+            _PAGE_METRICS_JS: [500, 800],
+            _PAGE_HEIGHT_JS: 500
+        }.get(script, True)
+        
+        browser = BrowserController(browser_name='chrome', simulate_behavior=True, show_progress=False)
+        browser.driver = mock_driver
+        browser.simulate_user_activity(0)
+        browser.simulate_user_activity(0)
+        
+        scripts = [c.args[0] for c in mock_driver.execute_script.call_args_list]
+        assert scripts == [_PAGE_METRICS_JS, _PAGE_HEIGHT_JS]
+        assert browser._viewport_height == 800
+    
     def test_visit_site_method_exists(self):
         """Test that visit_site method exists and has correct signature"""
         browser = BrowserController(browser_name='chrome')
@@ -266,6 +708,22 @@ class TestBrowserController:
         mock_navigate.assert_called_once_with('example.com')
         mock_activity.assert_called_once()
     
+    @patch('browser_controller.BrowserController.simulate_user_activity')
+    @patch('browser_controller.BrowserController.navigate_to', return_value=True)
+    def test_visit_site_preconnects_next_origin(self, mock_navigate, mock_activity, mock_driver):
+        """Test that the next site's origin is hinted while dwelling on the current one"""
+        browser = BrowserController(browser_name='chrome')
+        browser.driver = mock_driver
+        
+        browser.visit_site('example.com', duration_seconds=1, next_url='https://github.com/trending')
+        script, origin = mock_driver.execute_script.call_args.args
+        assert 'preconnect' in script
+        assert origin == 'https://github.com'
+        
+        mock_driver.execute_script.reset_mock()
+        browser.visit_site('example.com', duration_seconds=1, next_url='example.com/about')
+        mock_driver.execute_script.assert_not_called()
+    
     @patch('browser_controller.BrowserController.navigate_to')
     def test_visit_site_failure(self, mock_navigate, mock_driver):
         """Test failed visit_site call"""
@@ -288,6 +746,339 @@ class TestBrowserController:
                     assert browser is not None
 
 
+class TestRetryBackoff:
+    """Test the retry delay used by BrowserController.navigate_to"""
+    
+    def test_backoff_grows_and_is_capped(self):
+        """Test that the delay doubles per attempt within jitter bounds and never exceeds the page load timeout"""
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        base = BrowserController.RETRY_DELAY
+        
+        for attempt in range(4):
+            delay = browser._backoff(attempt)
+            expected = base * (2 ** attempt)
+            assert min(expected * 0.5, BrowserController.PAGE_LOAD_TIMEOUT) <= delay
+            assert delay <= min(expected * 1.5, BrowserController.PAGE_LOAD_TIMEOUT)
+    
+    def test_backoff_without_jitter(self):
+        """Test that disabling jitter gives deterministic delays"""
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        
+        with patch.object(BrowserController, 'RETRY_JITTER', False):
+            assert browser._backoff(0) == BrowserController.RETRY_DELAY
+            assert browser._backoff(1) == BrowserController.RETRY_DELAY * 2
+
+
+class TestBoundedGet:
+    """Test the hard timeout around driver.get()"""
+    
+    def test_hung_get_raises_timeout(self, mock_driver):
+        """Test that a get() that never returns is abandoned and reported as a timeout"""
+        from selenium.common.exceptions import TimeoutException
+        release = threading.Event()
+        mock_driver.get.side_effect = lambda url: release.wait(5)
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        
+        try:
+            with patch.object(BrowserController, 'PAGE_LOAD_TIMEOUT', 0), \
+                    patch.object(BrowserController, 'HARD_TIMEOUT_GRACE', 0.1), \
+                    pytest.raises(TimeoutException):
+                browser._bounded_get('https://hung.example')
+        finally:
+            release.set()
+        
+        mock_driver.execute_script.assert_not_called()
+        assert browser._driver_failed is True
+    
+    def test_hung_get_not_retried(self, mock_driver):
+        """Test that navigation gives up as soon as get() hangs, so the driver can be recycled"""
+        release = threading.Event()
+        mock_driver.get.side_effect = lambda url: release.wait(5)
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        
+        try:
+            with patch.object(BrowserController, 'PAGE_LOAD_TIMEOUT', 0), \
+                    patch.object(BrowserController, 'HARD_TIMEOUT_GRACE', 0.1):
+                assert browser.navigate_to('https://hung.example') is False
+        finally:
+            release.set()
+            BrowserController._circuits.clear()
+        
+        mock_driver.get.assert_called_once()
+        assert browser._driver_failed is True
+
+
+class TestCircuitBreaker:
+    """Test per-host circuit breaking in BrowserController"""
+    
+    def teardown_method(self):
+        BrowserController._circuits.clear()
+    
+    @patch('browser_controller.time.sleep')
+    def test_circuit_opens_after_repeated_failures(self, mock_sleep, mock_driver):
+        """Test that a dead host is skipped without touching the driver"""
+        from selenium.common.exceptions import TimeoutException
+        mock_driver.get.side_effect = TimeoutException("Timeout")
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        
+        for _ in range(BrowserController.CIRCUIT_FAILURE_THRESHOLD):
+            browser.navigate_to('dead.example')
+        calls_before = mock_driver.get.call_count
+        
+        result = browser.visit_site('dead.example', duration_seconds=1)
+        
+        assert result['status'] == 'circuit_open'
+        assert mock_driver.get.call_count == calls_before
+    
+    @patch('browser_controller.time.sleep')
+    def test_half_open_success_closes_circuit(self, mock_sleep, mock_driver):
+        """Test that a successful trial load after the timeout closes the circuit"""
+        from selenium.common.exceptions import TimeoutException
+        mock_driver.get.side_effect = TimeoutException("Timeout")
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        for _ in range(BrowserController.CIRCUIT_FAILURE_THRESHOLD):
+            browser.navigate_to('flaky.example')
+        
+        BrowserController._circuits['flaky.example']['opened_at'] -= BrowserController.CIRCUIT_RETRY_TIMEOUT
+        mock_driver.get.side_effect = None
+        
+        assert browser.navigate_to('flaky.example') is True
+        assert 'flaky.example' not in BrowserController._circuits
+    
+    @patch('browser_controller.time.sleep')
+    def test_half_open_admits_single_trial(self, mock_sleep, mock_driver):
+        """Test that only one caller gets the trial load once the retry timeout expires"""
+        from selenium.common.exceptions import TimeoutException
+        mock_driver.get.side_effect = TimeoutException("Timeout")
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        for _ in range(BrowserController.CIRCUIT_FAILURE_THRESHOLD):
+            browser.navigate_to('flaky.example')
+        BrowserController._circuits['flaky.example']['opened_at'] -= BrowserController.CIRCUIT_RETRY_TIMEOUT
+        
+        assert BrowserController._check_circuit('flaky.example') is True
+        assert BrowserController._check_circuit('flaky.example') is False
+        
+        # A failed trial re-opens the circuit and clears the marker
+        BrowserController._record_failure('flaky.example')
+        circuit = BrowserController._circuits['flaky.example']
+        assert circuit['state'] == 'open' and circuit['trial'] is False
+        circuit['opened_at'] -= circuit['retry_timeout']
+        assert BrowserController._check_circuit('flaky.example') is True
+    
+    def test_trial_released_without_verdict(self, mock_driver):
+        """Test that a trial ending without a host verdict lets the next caller try"""
+        from selenium.common.exceptions import InvalidSessionIdException
+        BrowserController._circuits['flaky.example'] = {
+            'state': 'open', 'failures': 5, 'opened_at': 0, 'retry_timeout': 0, 'trial': False
+        }
+        mock_driver.get.side_effect = InvalidSessionIdException("invalid session id")
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        
+        assert browser.navigate_to('flaky.example') is False
+        assert BrowserController._circuits['flaky.example']['trial'] is False
+        assert BrowserController._check_circuit('flaky.example') is True
+    
+    @patch('browser_controller.time.sleep')
+    def test_next_circuit_retry(self, mock_sleep, mock_driver):
+        """Test reporting when the earliest open circuit allows a retry"""
+        from selenium.common.exceptions import TimeoutException
+        mock_driver.get.side_effect = TimeoutException("Timeout")
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.driver = mock_driver
+        assert BrowserController.next_circuit_retry() is None
+        
+        for _ in range(BrowserController.CIRCUIT_FAILURE_THRESHOLD):
+            browser.navigate_to('dead.example')
+        circuit = BrowserController._circuits['dead.example']
+        assert BrowserController.next_circuit_retry() == circuit['opened_at'] + circuit['retry_timeout']
+
+
+class TestBrowserPool:
+    """Test warm driver pooling"""
+    
+    def teardown_method(self):
+        BrowserController.shutdown_pool()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_stop_returns_driver_to_pool(self, mock_driver_manager, mock_chrome):
+        """Test that pooled controllers park the driver instead of quitting it"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        driver = MagicMock()
+        mock_chrome.return_value = driver
+        
+        browser = BrowserController(browser_name='chrome', use_pool=True)
+        browser.start()
+        browser.stop()
+        
+        driver.quit.assert_not_called()
+        driver.delete_all_cookies.assert_called_once()
+        assert browser.driver is None
+        assert BrowserController.pool.idle_count(browser._pool_key) == 1
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_start_reuses_pooled_driver(self, mock_driver_manager, mock_chrome):
+        """Test that a second controller picks up the warm driver"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        mock_chrome.return_value = MagicMock()
+        
+        first = BrowserController(browser_name='chrome', use_pool=True)
+        first.start()
+        driver = first.driver
+        first.stop()
+        
+        second = BrowserController(browser_name='chrome', use_pool=True)
+        assert second.start() is True
+        
+        assert second.driver is driver
+        mock_chrome.assert_called_once()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_driver_recycled_after_max_uses(self, mock_driver_manager, mock_chrome):
+        """Test that worn-out drivers are quit instead of pooled"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        driver = MagicMock()
+        mock_chrome.return_value = driver
+        
+        browser = BrowserController(browser_name='chrome', use_pool=True)
+        browser.start()
+        browser._uses = BrowserController.MAX_USES_PER_INSTANCE
+        browser.stop()
+        
+        driver.quit.assert_called_once()
+        assert BrowserController.pool.idle_count(browser._pool_key) == 0
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    @patch('browser_controller.BrowserController.simulate_user_activity')
+    def test_visit_site_recycles_old_driver(self, mock_activity, mock_driver_manager, mock_chrome):
+        """Test that a driver past its lifetime is replaced after the visit"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        old_driver, new_driver = MagicMock(), MagicMock()
+        mock_chrome.side_effect = [old_driver, new_driver]
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.start()
+        BrowserController._driver_started[old_driver] -= BrowserController.MAX_LIFETIME_SEC
+        
+        result = browser.visit_site('example.com', duration_seconds=1)
+        
+        assert result['status'] == 'success'
+        old_driver.quit.assert_called_once()
+        assert browser.driver is new_driver
+        assert browser._uses == 0
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    @patch('browser_controller.BrowserController.simulate_user_activity')
+    def test_visit_site_recycles_failed_driver(self, mock_activity, mock_driver_manager, mock_chrome):
+        """Test that a driver flagged as failed is replaced, retrying a failed restart"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        old_driver, new_driver = MagicMock(), MagicMock()
+        mock_chrome.side_effect = [old_driver, Exception("chromedriver crashed"), new_driver]
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.start()
+        old_driver.get.side_effect = lambda url: setattr(browser, '_driver_failed', True)
+        
+        with patch.object(BrowserController, 'RETRY_DELAY', 0):
+            browser.visit_site('example.com', duration_seconds=1)
+        
+        old_driver.quit.assert_called_once()
+        assert browser.driver is new_driver
+        assert browser._driver_failed is False
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_recycle_gives_up_after_retries(self, mock_driver_manager, mock_chrome):
+        """Test that recycling stops retrying a browser that won't start"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        driver = MagicMock()
+        mock_chrome.side_effect = [driver] + [Exception("no browser")] * (BrowserController.MAX_RETRIES + 1)
+        
+        browser = BrowserController(browser_name='chrome', show_progress=False)
+        browser.start()
+        
+        with patch.object(BrowserController, 'RETRY_DELAY', 0):
+            assert browser._recycle_driver() is False
+        assert browser.driver is None
+        assert mock_chrome.call_count == BrowserController.MAX_RETRIES + 2
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    @patch('browser_controller.BrowserController.simulate_user_activity')
+    def test_visit_sites_concurrent(self, mock_activity, mock_driver_manager, mock_chrome):
+        """Test concurrent visits return results in input order and pool the drivers"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        mock_chrome.side_effect = lambda **kwargs: MagicMock()
+        urls = ['a.com', 'b.com', 'c.com', 'd.com']
+        
+        browser = BrowserController(browser_name='chrome', headless=True)
+        results = browser.visit_sites_concurrent(urls, duration_seconds=1, concurrency=2)
+        
+        assert [r['url'] for r in results] == urls
+        assert all(r['status'] == 'success' for r in results)
+        assert mock_chrome.call_count <= 2
+        assert BrowserController.pool.idle_count(browser._pool_key) == mock_chrome.call_count
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_profile_dir_used_by_one_browser_at_a_time(self, mock_driver_manager, mock_chrome, tmp_path):
+        """Test that a persistent profile is shared sequentially, never concurrently"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        mock_chrome.side_effect = lambda **kwargs: MagicMock()
+        profile = str(tmp_path / 'profile')
+        
+        first = BrowserController(browser_name='chrome', profile_dir=profile)
+        second = BrowserController(browser_name='chrome', profile_dir=profile)
+        first.start()
+        second.start()
+        
+        first_args = mock_chrome.call_args_list[0].kwargs['options'].arguments
+        second_args = mock_chrome.call_args_list[1].kwargs['options'].arguments
+        assert f'--user-data-dir={profile}' in first_args
+        assert not any(arg.startswith('--user-data-dir') for arg in second_args)
+        
+        first.stop()
+        second.stop()
+        third = BrowserController(browser_name='chrome', profile_dir=profile)
+        third.start()
+        assert f'--user-data-dir={profile}' in mock_chrome.call_args.kwargs['options'].arguments
+        third.stop()
+    
+    @patch('browser_controller.webdriver.Chrome')
+    @patch('browser_controller.ChromeDriverManager')
+    def test_prewarm_and_shutdown(self, mock_driver_manager, mock_chrome):
+        """Test pre-warming drivers and draining the pool"""
+        mock_driver_manager.return_value.install.return_value = '/path/to/chromedriver'
+        drivers = [MagicMock(), MagicMock()]
+        mock_chrome.side_effect = drivers
+        
+        browser = BrowserController(browser_name='chrome', use_pool=True)
+        assert browser.prewarm(2) == 2
+        assert BrowserController.pool.idle_count(browser._pool_key) == 2
+        
+        BrowserController.shutdown_pool()
+        
+        for driver in drivers:
+            driver.quit.assert_called_once()
+
+
 # ============================================================================
 # TEST AUTOMATOR TESTS
 # ============================================================================
@@ -311,6 +1102,22 @@ class TestOSCARTestAutomator:
         assert automator._parse_duration('30m') == 1800
         assert automator._parse_duration('1') == 60
     
+    def test_format_time(self, temp_config_file):
+        """Test human-readable durations at each unit boundary"""
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        
+        assert automator._format_time(59.9) == '59s'
+        assert automator._format_time(60) == '1m 0s'
+        assert automator._format_time(3599) == '59m 59s'
+        assert automator._format_time(3600) == '1h 0m'
+        assert automator._format_time(7384) == '2h 3m'
+        assert automator._format_time(-0.4) == '0s'
+    
+    def test_parse_duration_without_instance(self):
+        """Test that durations parse without building an automator"""
+        assert OSCARTestAutomator._parse_duration('2h') == 7200
+        assert OSCARTestAutomator._parse_duration('45', default_unit='seconds') == 45
+    
     def test_parse_duration_hours(self, temp_config_file):
         """Test parsing duration in hours"""
         automator = OSCARTestAutomator(config_path=temp_config_file)
@@ -325,6 +1132,16 @@ class TestOSCARTestAutomator:
         assert automator._parse_duration('90s') == 90
         assert automator._parse_duration('3600s') == 3600
     
+    def test_parse_duration_plain_and_spaced(self, temp_config_file):
+        """Test default units and whitespace between number and unit"""
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        
+        assert automator._parse_duration('15') == 900
+        assert automator._parse_duration('15', default_unit='seconds') == 15
+        assert automator._parse_duration(' 2 M ') == 120
+        with pytest.raises(ValueError, match="Invalid duration"):
+            automator._parse_duration('1.5h')
+    
     def test_get_sites_to_test_all(self, temp_config_file):
         """Test getting all sites"""
         automator = OSCARTestAutomator(config_path=temp_config_file)
@@ -363,6 +1180,255 @@ class TestOSCARTestAutomator:
         sites = automator._get_sites_to_test(sample_size=100)
         
         assert len(sites) == 7  # Should return all available sites
+    
+    def test_setup_logging_writes_through_queue(self, tmp_path, monkeypatch):
+        """Test that records reach the log file once the listener is stopped"""
+        import logging
+        monkeypatch.chdir(tmp_path)
+        root = logging.getLogger()
+        handlers_before = list(root.handlers)
+        
+        listener = setup_logging()
+        try:
+            logging.getLogger('test_automator').info("queued message")
+        finally:
+            listener.stop()
+            for handler in root.handlers[len(handlers_before):]:
+                root.removeHandler(handler)
+            for handler in listener.handlers:
+                handler.close()
+        
+        (log_file,) = tmp_path.glob('oscar_test_*.log')
+        assert 'queued message' in log_file.read_text(encoding='utf-8')
+    
+    def test_setup_logging_rotates_compressed(self, tmp_path, monkeypatch):
+        """Test that a full log rotates into a gzip-compressed backup"""
+        import gzip
+        import logging
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr('test_automator.LOG_MAX_BYTES', 200)
+        root = logging.getLogger()
+        handlers_before = list(root.handlers)
+        
+        listener = setup_logging()
+        try:
+            for i in range(5):
+                logging.getLogger('test_automator').info("rotated message %d %s", i, 'x' * 60)
+        finally:
+            listener.stop()
+            for handler in root.handlers[len(handlers_before):]:
+                root.removeHandler(handler)
+            for handler in listener.handlers:
+                handler.close()
+        
+        backups = sorted(tmp_path.glob('oscar_test_*.log.*.gz'))
+        assert backups
+        with gzip.open(backups[-1], 'rt', encoding='utf-8') as f:
+            assert 'rotated message 0' in f.read()
+    
+    def test_csv_streamed_per_visit(self, temp_config_file, tmp_path, monkeypatch):
+        """Test that each visit is on disk as soon as it is recorded"""
+        import csv
+        monkeypatch.chdir(tmp_path)
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        results = [
+            {'timestamp': '2025-01-01T00:00:00', 'url': 'github.com', 'category': 'Development',
+             'title': 'GitHub, Inc.', 'duration': 1.5, 'status': 'success', 'cycle': 1, 'error': None},
+            {'timestamp': '2025-01-01T00:00:02', 'url': 'bbc.com', 'category': 'News/Information',
+             'title': '', 'duration': 0.2, 'status': 'failed', 'cycle': 1, 'error': 'Navigation failed'}
+        ]
+        
+        automator._open_csv()
+        for result in results:
+            automator.visit_results.append(result)
+            automator._write_csv_row(result)
+        
+        with open(automator.csv_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        automator._close_csv()
+        
+        assert rows[0] == OSCARTestAutomator.CSV_COLUMNS
+        assert rows[1][3] == 'GitHub, Inc.'
+        assert rows[2][7] == 'Navigation failed'
+    
+    def test_empty_csv_removed(self, temp_config_file, tmp_path, monkeypatch):
+        """Test that a run without visits leaves no CSV behind"""
+        monkeypatch.chdir(tmp_path)
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        
+        automator._open_csv()
+        automator._close_csv()
+        
+        assert not Path(automator.csv_path).exists()
+    
+    def test_save_parquet(self, temp_config_file, tmp_path, monkeypatch):
+        """Test that results round-trip through the Parquet file"""
+        pl = pytest.importorskip('polars')
+        monkeypatch.chdir(tmp_path)
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        automator.visit_results = [
+            {'timestamp': '2024-01-01T00:00:00', 'url': 'https://a.com', 'category': 'news',
+             'title': 'A', 'duration': 1.5, 'status': 'success', 'cycle': 1},
+            {'timestamp': '2024-01-01T00:00:02', 'url': 'https://b.com', 'category': 'news',
+             'title': '', 'duration': 0.4, 'status': 'failed', 'cycle': 1, 'error': 'Timeout'},
+        ]
+        
+        frame = pl.read_parquet(automator._save_parquet())
+        
+        assert frame.columns == OSCARTestAutomator.CSV_COLUMNS
+        assert frame['url'].to_list() == ['https://a.com', 'https://b.com']
+        assert frame['error'].to_list() == [None, 'Timeout']
+    
+    def test_save_parquet_without_polars(self, temp_config_file, tmp_path, monkeypatch):
+        """Test that Parquet output is skipped when polars is missing"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr('test_automator.POLARS_AVAILABLE', False)
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        automator.visit_results = [{'url': 'https://a.com', 'status': 'success'}]
+        
+        assert automator._save_parquet() is None
+        assert not (tmp_path / 'data').exists()
+    
+    def test_dump_json_without_orjson(self, monkeypatch):
+        """Test that both JSON encoders produce the same document"""
+        data = {'summary': {'success_rate': 75.0}, 'visits': [{'title': 'Café', 'error': None}]}
+        
+        encoded = _dump_json(data)
+        monkeypatch.setattr('test_automator.ORJSON_AVAILABLE', False)
+        fallback = _dump_json(data)
+        
+        assert isinstance(encoded, bytes) and isinstance(fallback, bytes)
+        assert json.loads(encoded) == json.loads(fallback) == data
+    
+    def test_dump_json_stringifies_other_values(self, monkeypatch):
+        """Test that values without a JSON type are written as strings by both encoders"""
+        data = {'started': datetime(2024, 1, 2, 3, 4, 5), 'log': Path('data/logs/run.log')}
+        expected = {'started': str(data['started']), 'log': str(data['log'])}
+        
+        encoded = _dump_json(data)
+        monkeypatch.setattr('test_automator.ORJSON_AVAILABLE', False)
+        
+        assert json.loads(encoded) == json.loads(_dump_json(data)) == expected
+    
+    def test_summary_json_written_atomically(self, temp_config_file, tmp_path, monkeypatch):
+        """Test that the results JSON is complete and no temp file is left behind"""
+        monkeypatch.chdir(tmp_path)
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        automator.start_time, automator.end_time = 100.0, 160.0
+        automator.visit_results = [
+            {'url': 'https://a.com', 'status': 'success', 'category': 'news', 'title': 'A'},
+        ]
+        
+        automator._generate_summary()
+        
+        files = list(tmp_path.iterdir())
+        assert len(files) == 1 and files[0].name.startswith('oscar_results_')
+        report = json.loads(files[0].read_text(encoding='utf-8'))
+        assert report['summary']['total_visits'] == 1
+        assert report['visits'] == automator.visit_results
+    
+    def test_get_sites_dedupes_across_categories(self, tmp_path):
+        """Test that a URL in two requested categories is only scheduled once"""
+        config_path = tmp_path / 'config.json'
+        config_path.write_text(json.dumps({
+            "browser_categories": {
+                "Development": ["github.com", "stackoverflow.com"],
+                "Social Media": ["twitter.com", "github.com"]
+            }
+        }))
+        automator = OSCARTestAutomator(config_path=str(config_path))
+        
+        sites = automator._get_sites(categories='Development,Social Media')
+        
+        assert sites == [
+            ('github.com', 'Development'),
+            ('stackoverflow.com', 'Development'),
+            ('twitter.com', 'Social Media')
+        ]
+    
+    def test_get_sites_uses_config_category_names(self, temp_config_file):
+        """Test that sites are labelled with the config's spelling of a category"""
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        
+        sites = automator._get_sites(categories='development,DEVELOPMENT')
+        
+        assert sites == [('github.com', 'Development'), ('stackoverflow.com', 'Development')]
+    
+    def test_worker_visit_times_from_own_rng(self, temp_config_file):
+        """Test that a worker draws visit times from the RNG it is given"""
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        sites = [('https://a.com', 'news'), ('https://b.com', 'news')]
+        
+        def visit_times(seed):
+            browser = MagicMock(show_progress=False)
+            
+            def visit(url, duration_seconds, next_url=None):
+                if browser.visit_site.call_count == 5:
+                    automator._stop_event.set()
+                return {'url': url, 'status': 'success', 'duration': 0.0, 'title': ''}
+            browser.visit_site.side_effect = visit
+            automator._stop_event.clear()
+            automator._worker_loop(browser, automator._site_schedule(sites), time.monotonic() + 3600,
+                                   10, 100, len(sites), MagicMock(total=3600, n=0), rng=random.Random(seed))
+            return [c.args[1] for c in browser.visit_site.call_args_list]
+        
+        assert visit_times(7) == visit_times(7)
+        assert visit_times(7) != visit_times(8)
+    
+    def test_worker_stops_without_browser(self, temp_config_file):
+        """Test that a worker whose browser couldn't restart ends instead of spinning"""
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        sites = [('https://a.com', 'news'), ('https://b.com', 'news')]
+        browser = MagicMock(show_progress=False)
+        
+        def visit(url, duration_seconds, next_url=None):
+            browser.driver = None
+            return {'url': url, 'status': 'failed', 'duration': 0, 'title': '', 'error': 'Navigation failed'}
+        browser.visit_site.side_effect = visit
+        
+        automator._worker_loop(browser, automator._site_schedule(sites), time.monotonic() + 3600,
+                               10, 10, len(sites), MagicMock(total=3600, n=0))
+        
+        assert browser.visit_site.call_count == 1
+        assert len(automator.visit_results) == 1
+    
+    def test_open_circuits_not_recorded(self, temp_config_file):
+        """Test that skipped hosts aren't recorded and the worker waits once all are skipped"""
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        sites = [('https://a.com', 'news'), ('https://b.com', 'news')]
+        browser = MagicMock(show_progress=False)
+        browser.visit_site.side_effect = lambda url, duration_seconds, next_url=None: {
+            'url': url, 'status': 'circuit_open', 'duration': 0, 'title': '', 'error': 'skipped'
+        }
+        
+        with patch.object(BrowserController, 'next_circuit_retry', return_value=time.monotonic() + 60), \
+                patch.object(automator._stop_event, 'wait', side_effect=lambda timeout: automator._stop_event.set()) as mock_wait:
+            automator._worker_loop(browser, automator._site_schedule(sites), time.monotonic() + 3600,
+                                   10, 10, len(sites), MagicMock(total=3600, n=0))
+        
+        assert automator.visit_results == []
+        assert browser.visit_site.call_count == len(sites)
+        assert 0 < mock_wait.call_args.args[0] <= 60
+    
+    def test_compute_summary(self, temp_config_file):
+        """Test that summary statistics are counted once, most-visited first"""
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        automator.start_time, automator.end_time = 100.0, 160.0
+        automator.visit_results = [
+            {'url': 'https://a.com', 'status': 'success', 'category': 'news'},
+            {'url': 'https://b.com', 'status': 'success', 'category': 'social'},
+            {'url': 'https://c.com', 'status': 'success', 'category': 'social'},
+            {'url': 'https://d.com', 'status': 'failed', 'category': 'news', 'error': 'Timeout'},
+        ]
+        
+        summary = automator._compute_summary()
+        
+        assert summary['total_time'] == 60.0
+        assert summary['successful'] == 3
+        assert summary['failed'] == 1
+        assert summary['success_rate'] == 75.0
+        assert summary['top_categories'] == [('social', 2), ('news', 1)]
+        assert [r['url'] for r in summary['failures']] == ['https://d.com']
 
 
 # ============================================================================
@@ -427,6 +1493,53 @@ class TestCommandLineArguments:
             assert args.min_time == '30'
             assert args.max_time == '120'
     
+    def test_workers_argument(self):
+        """Test concurrent workers argument"""
+        with patch('sys.argv', ['test_automator.py', '--workers', '4']):
+            args = parse_arguments()
+            assert args.workers == 4
+        with patch('sys.argv', ['test_automator.py', '--parallel', '3']):
+            assert parse_arguments().workers == 3
+    
+    def test_seed_argument(self):
+        """Test seeding for repeatable runs"""
+        with patch('sys.argv', ['test_automator.py']):
+            assert parse_arguments().seed is None
+        with patch('sys.argv', ['test_automator.py', '--seed', '42']):
+            assert parse_arguments().seed == 42
+    
+    def test_minimal_loads_argument(self):
+        """Test opting in to blocking images, fonts and video"""
+        with patch('sys.argv', ['test_automator.py']):
+            assert parse_arguments().minimal_loads is False
+        with patch('sys.argv', ['test_automator.py', '--minimal-loads']):
+            assert parse_arguments().minimal_loads is True
+    
+    def test_validate_arguments(self):
+        """Test that bad option values are rejected before a run starts"""
+        with patch('sys.argv', ['test_automator.py']):
+            validate_arguments(parse_arguments())
+        with patch('sys.argv', ['test_automator.py', '--duration', '1.5h']):
+            with pytest.raises(ValueError, match="Invalid duration"):
+                validate_arguments(parse_arguments())
+        with patch('sys.argv', ['test_automator.py', '--browser', 'firefox', '--attach', '127.0.0.1:9222']):
+            with pytest.raises(ValueError, match="--attach"):
+                validate_arguments(parse_arguments())
+    
+    def test_attach_argument(self):
+        """Test attaching to a running browser"""
+        with patch('sys.argv', ['test_automator.py']):
+            assert parse_arguments().attach is None
+        with patch('sys.argv', ['test_automator.py', '--attach', '127.0.0.1:9222']):
+            assert parse_arguments().attach == '127.0.0.1:9222'
+    
+    def test_parquet_argument(self):
+        """Test Parquet output flag"""
+        with patch('sys.argv', ['test_automator.py']):
+            assert parse_arguments().parquet is False
+        with patch('sys.argv', ['test_automator.py', '--parquet']):
+            assert parse_arguments().parquet is True
+    
     def test_config_argument(self):
         """Test custom config path"""
         with patch('sys.argv', ['test_automator.py', '--config', 'custom.json']):
@@ -475,6 +1588,84 @@ class TestIntegration:
         assert mock_start.called
         assert mock_stop.called
     
+    @patch('browser_controller.BrowserController._launch_driver', autospec=True)
+    @patch('browser_controller.BrowserController.visit_site', autospec=True)
+    def test_repeated_runs_reuse_session(self, mock_visit, mock_launch,
+                                         temp_config_file, tmp_path, monkeypatch):
+        """Test that a second run() picks up the first run's warm browser"""
+        import argparse
+        monkeypatch.chdir(tmp_path)
+        mock_launch.side_effect = lambda browser: MagicMock()
+        mock_visit.return_value = {'url': 'https://example.com', 'status': 'success',
+                                   'duration': 0.0, 'title': 'Example', 'error': None}
+        args = argparse.Namespace(
+            browser='chrome', headless=True, simulate_behavior=False,
+            duration='1s', min_time='1', max_time='1',
+            categories=None, sample=None, workers=1, parquet=False, attach=None, seed=None, minimal_loads=False
+        )
+        
+        try:
+            OSCARTestAutomator(config_path=temp_config_file, reuse_browsers=True).run(args)
+            OSCARTestAutomator(config_path=temp_config_file, reuse_browsers=True).run(args)
+        finally:
+            BrowserController.shutdown_pool()
+        
+        assert mock_launch.call_count == 1
+    
+    @patch('browser_controller.BrowserController._launch_driver', autospec=True)
+    @patch('browser_controller.BrowserController.visit_site', autospec=True)
+    def test_single_run_quits_browser(self, mock_visit, mock_launch,
+                                      temp_config_file, tmp_path, monkeypatch):
+        """Test that a run quits its browser instead of pooling it by default"""
+        import argparse
+        monkeypatch.chdir(tmp_path)
+        driver = MagicMock()
+        mock_launch.return_value = driver
+        mock_visit.return_value = {'url': 'https://example.com', 'status': 'success',
+                                   'duration': 0.0, 'title': 'Example', 'error': None}
+        args = argparse.Namespace(
+            browser='chrome', headless=True, simulate_behavior=False,
+            duration='1s', min_time='1', max_time='1',
+            categories=None, sample=None, workers=1, parquet=False, attach=None, seed=None, minimal_loads=False
+        )
+        
+        OSCARTestAutomator(config_path=temp_config_file).run(args)
+        
+        driver.quit.assert_called_once()
+        driver.delete_all_cookies.assert_not_called()
+    
+    @patch('browser_controller.BrowserController.start', autospec=True)
+    @patch('browser_controller.BrowserController.stop', autospec=True)
+    @patch('browser_controller.BrowserController.visit_site', autospec=True)
+    def test_run_with_concurrent_workers(self, mock_visit, mock_stop, mock_start,
+                                         temp_config_file, tmp_path, monkeypatch):
+        """Test that --workers spreads visits over several browsers"""
+        import argparse
+        monkeypatch.chdir(tmp_path)
+        mock_start.return_value = True
+        
+        def visit(browser, url, duration_seconds, next_url=None):
+            time.sleep(0.05)
+            return {'url': url, 'status': 'success', 'duration': 0.05, 'title': 'Example', 'error': None}
+        mock_visit.side_effect = visit
+        
+        automator = OSCARTestAutomator(config_path=temp_config_file)
+        args = argparse.Namespace(
+            browser='chrome', headless=True, simulate_behavior=False,
+            duration='2s', min_time='1', max_time='1',
+            categories=None, sample=None, workers=2, parquet=False, attach=None, seed=None, minimal_loads=False
+        )
+        
+        automator.run(args)
+        
+        browsers_used = {call.args[0] for call in mock_visit.call_args_list}
+        assert len(browsers_used) == 2
+        assert mock_stop.call_count == 2
+        assert len(automator.visit_results) == mock_visit.call_count
+        assert all('cycle' in r and 'category' in r for r in automator.visit_results)
+        with open(automator.csv_path, encoding='utf-8') as f:
+            assert len(f.readlines()) == len(automator.visit_results) + 1
+    
     def test_readme_examples_parse_correctly(self):
         """Test that all README examples parse without errors"""
         examples = [